@@ -12,18 +12,17 @@ AGENTS.md 명세에 따른 역할:
 
 import os
 import logging
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Any, Iterator, List, Optional, Union
 from PIL import Image
 from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
 
+from app.core.llm_utils import get_chat_model
 from app.agents.conversation_manager import CaseContext, PatientSummary
 from app.agents.admin_workflow import AdminWorkflow, AdminWorkflowState
-from app.tools.medblip_tool import MedBLIPTool
-from app.agents.prompts.admin_prompts import (
-    ADMIN_PATIENT_SUMMARY_PROMPT,
-    ADMIN_SAFETY_DISCLAIMERS
-)
+from app.agents.prompts.admin_prompts import ADMIN_SAFETY_DISCLAIMERS
+
+if TYPE_CHECKING:  # pragma: no cover - typing only (torch/transformers are imported on first use)
+    from app.tools.medblip_tool import MedBLIPTool
 
 # Docker 로그에서 확인 가능한 로거 설정
 logger = logging.getLogger(__name__)
@@ -32,6 +31,23 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+# 단계별 다음 워크플로우 처리 메서드 (if/elif 대신 dict dispatch)
+STAGE_HANDLERS = {
+    "demographics": "_check_and_move_to_history",
+    "history": "_check_and_move_to_symptoms",
+    "symptoms": "_check_and_move_to_medications",
+    "medications": "_check_and_move_to_image",
+    "image_request": "_check_and_handle_image",
+    "image_analysis": "_check_and_handle_image",
+}
+
+# 단계별 (상태 키, 여부 플래그, 부정 키워드) - 입력 원문 저장 + 해당 여부만 판단하는 단계
+STAGE_INFO_TABLE = {
+    "history": ("history", "has_history", ("없",)),
+    "symptoms": ("symptoms", "has_symptoms", ("없", "검진")),
+    "medications": ("meds", "has_medications", ("없",)),
+}
+
 
 class AdminAgent:
     """
@@ -44,7 +60,8 @@ class AdminAgent:
     - 합의 후 최종 의료 출력을 환자 친화적 한국어로 재작성
     """
 
-    def __init__(self, openai_api_key: Optional[str] = None):
+    def __init__(self, openai_api_key: Optional[str] = None,
+                 medblip_tool_factory: Optional[Callable[[], "MedBLIPTool"]] = None):
         logger.info("🚀 AdminAgent 초기화 시작")
 
         self.api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
@@ -52,29 +69,20 @@ class AdminAgent:
         # LLM 초기화 (환자 친화적 재작성용)
         if self.api_key:
             logger.info("🔑 OpenAI API 키 발견 - LLM 초기화 중")
-            self.llm = ChatOpenAI(
-                api_key=self.api_key,
-                model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                temperature=0.7
+            self.llm = get_chat_model(
+                self.api_key, os.getenv("OPENAI_MODEL", "gpt-4o-mini"), 0.7
             )
             logger.info("✅ OpenAI LLM 초기화 완료")
         else:
             logger.warning("⚠️ OpenAI API 키 없음 - 오프라인 모드로 동작")
             self.llm = None
 
-        # MedBLIP 도구 초기화
-        logger.info("🔧 MedBLIP 도구 초기화 중...")
-        try:
-            self.medblip_tool = MedBLIPTool()
-            logger.info("✅ MedBLIP 도구 초기화 완료")
-        except Exception as e:
-            logger.error(f"❌ MedBLIP 도구 초기화 실패: {str(e)}")
-            raise
-
-        # Admin 워크플로우 초기화
+        # Admin 워크플로우 초기화 (MedBLIP 모델은 이미지 단계에서 로드)
         logger.info("🔄 Admin 워크플로우 초기화 중...")
         try:
-            self.admin_workflow = AdminWorkflow(self.medblip_tool)
+            self.admin_workflow = AdminWorkflow(
+                medblip_tool_factory=medblip_tool_factory
+            )
             logger.info("✅ Admin 워크플로우 초기화 완료")
         except Exception as e:
             logger.error(f"❌ Admin 워크플로우 초기화 실패: {str(e)}")
@@ -85,6 +93,15 @@ class AdminAgent:
 
         logger.info("🎉 AdminAgent 초기화 성공적으로 완료")
 
+    @property
+    def medblip_tool(self) -> "MedBLIPTool":
+        """MedBLIP 도구 (첫 접근 시 모델 로드)"""
+        return self.admin_workflow.medblip_tool
+
+    def prepare_image_analysis(self) -> None:
+        """이미지 업로드 단계 진입 시 MedBLIP 모델을 미리 로드"""
+        self.medblip_tool.ensure_loaded()
+
     def start_intake(self) -> Dict[str, Any]:
         """새로운 intake 세션 시작"""
         logger.info("🆕 새로운 intake 세션 시작")
@@ -121,9 +138,13 @@ class AdminAgent:
             return self._format_response(success=False, error=str(e))
 
     def process_user_input(self, user_input: str,
-                           image: Optional[Image.Image] = None
+                           image: Optional[Union[Image.Image, List[Image.Image]]] = None
                            ) -> Dict[str, Any]:
-        """사용자 입력 처리 및 워크플로우 진행"""
+        """사용자 입력 처리 및 워크플로우 진행
+
+        image에는 단일 PIL Image 또는 여러 장의 리스트를 전달할 수 있으며,
+        여러 장은 MedBLIP에서 한 번의 배치로 분석됩니다.
+        """
         logger.info(f"📝 사용자 입력 처리: {user_input[:50]}...")
 
         if not self.current_state:
@@ -174,18 +195,9 @@ class AdminAgent:
         logger.info(f"📍 현재 단계: {current_stage}")
 
         # 현재 단계에 따라 적절한 노드 실행
-        if current_stage == "demographics":
-            self._check_and_move_to_history()
-        elif current_stage == "history":
-            self._check_and_move_to_symptoms()
-        elif current_stage == "symptoms":
-            self._check_and_move_to_medications()
-        elif current_stage == "medications":
-            self._check_and_move_to_image()
-        elif current_stage == "image_request":
-            self._check_and_handle_image()
-        elif current_stage == "image_analysis":
-            self._check_and_handle_image()
+        handler_name = STAGE_HANDLERS.get(current_stage)
+        if handler_name:
+            getattr(self, handler_name)()
 
         # 이미지가 업로드된 경우 즉시 분석 수행
         if (self.current_state.get("uploaded_image") and
@@ -297,36 +309,15 @@ class AdminAgent:
 
             self.current_state["demographics"].update(demographics)
 
-        elif stage == "history":
-            # 병력 정보 추출
-            history = {"raw_input": user_input}
-            if "없" in user_input:
-                history["has_history"] = False
-            else:
-                history["has_history"] = True
-
-            self.current_state["history"].update(history)
-
-        elif stage == "symptoms":
-            # 증상 정보 추출
-            symptoms = {"raw_input": user_input}
-            if any(keyword in user_input for keyword in
-                   ["없", "검진"]):
-                symptoms["has_symptoms"] = False
-            else:
-                symptoms["has_symptoms"] = True
-
-            self.current_state["symptoms"].update(symptoms)
-
-        elif stage == "medications":
-            # 약물 정보 추출
-            meds = {"raw_input": user_input}
-            if "없" in user_input:
-                meds["has_medications"] = False
-            else:
-                meds["has_medications"] = True
-
-            self.current_state["meds"].update(meds)
+        elif stage in STAGE_INFO_TABLE:
+            # 병력/증상/약물: 원문 저장 + 부정 키워드로 해당 여부 판단
+            state_key, flag_key, negative_keywords = STAGE_INFO_TABLE[stage]
+            self.current_state[state_key].update({
+                "raw_input": user_input,
+                flag_key: not any(
+                    keyword in user_input for keyword in negative_keywords
+                ),
+            })
 
     def _format_response(self, success: bool,
                          error: Optional[str] = None) -> Dict[str, Any]:
@@ -362,13 +353,21 @@ class AdminAgent:
         return self.admin_workflow.get_case_context(self.current_state)
 
     def create_patient_summary(self,
-                               supervisor_decision: Dict[str, Any]
+                               supervisor_decision: Dict[str, Any],
+                               stream_writer: Optional[
+                                   Callable[[Iterator[str]], str]
+                               ] = None
                                ) -> PatientSummary:
         """
         Supervisor Agent의 합의 결과를 환자 친화적 한국어로 재작성
 
         AGENTS.md 명세:
         - 합의 후, 최종 의료 출력을 환자 친화적 언어로 재작성하고 UI로 반환
+
+        Args:
+            supervisor_decision: Supervisor Agent의 최종 합의 결과
+            stream_writer: 토큰 iterator를 받아 화면에 출력하고 전체 텍스트를
+                반환하는 함수 (예: st.write_stream). 지정하면 LLM 응답을 스트리밍합니다.
         """
         if self.llm is None:
             # 오프라인 모드: 기본 템플릿 사용
@@ -407,8 +406,13 @@ class AdminAgent:
             logger.info("🏥 [Admin] 환자 친화적 요약 생성 중...")
             logger.info(f"📝 Supervisor Decision Input: {supervisor_decision}")
 
-            response = self.llm.invoke([HumanMessage(content=translate_prompt)])
-            summary_text = response.content
+            messages = [HumanMessage(content=translate_prompt)]
+            if stream_writer is not None:
+                summary_text = stream_writer(
+                    chunk.content for chunk in self.llm.stream(messages)
+                )
+            else:
+                summary_text = self.llm.invoke(messages).content
 
             # Log generated summary
             logger.info("📊 [Admin] 생성된 환자 요약:")
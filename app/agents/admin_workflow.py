@@ -7,26 +7,84 @@ Admin Agent의 intake 워크플로우를 관리하는 별도 모듈
 
 from __future__ import annotations
 
-from typing import Dict, Any, Optional
-from PIL import Image
+from typing import TYPE_CHECKING, Callable, Optional
 from langgraph.graph import StateGraph, START, END
 
 from app.agents.conversation_manager import CaseContext
-from app.agents.shared_state import SharedMedicalState, StateManager
-from app.tools.medblip_tool import MedBLIPTool
+from app.agents.shared_state import SharedMedicalState
+
+if TYPE_CHECKING:  # pragma: no cover - typing only (torch/transformers are imported on first use)
+    from app.tools.medblip_tool import MedBLIPTool
 
 
 # AdminWorkflowState는 이제 SharedMedicalState를 사용합니다
 AdminWorkflowState = SharedMedicalState
 
+# 세션 시작 시 고정 안내 메시지 (모듈 로드 시 한 번만 생성)
+GREETING_MESSAGE = "\n".join([
+    "안녕하세요! 🏥 Multi-Agent 의료 상담 서비스입니다.",
+    "",
+    "저는 Admin Agent로, 여러분의 의료 상담을 위한 정보를 수집하겠습니다.",
+    "",
+    "📋 진행 과정:",
+    "1. 기본 정보 수집 (인구학적 정보)",
+    "2. 과거 병력 및 가족력",
+    "3. 현재 증상 상세 문진",
+    "4. 복용 중인 약물 정보",
+    "5. 방사선 이미지 분석 (선택사항)",
+    "6. 전문 의료진 Multi-Agent 상담으로 연결",
+    "",
+    "⚠️ 본 서비스는 교육 및 참고 목적이며,",
+    "확정적 진단이나 치료를 제공하지 않습니다.",
+    "응급상황에서는 즉시 응급실을 방문하시기 바랍니다.",
+    "",
+    "편안하게 말씀해 주세요. 시작하겠습니다!",
+])
+
+DEMOGRAPHICS_QUESTION = "\n".join([
+    "기본 정보를 알려주세요:",
+    "",
+    "1. 나이 (또는 연령대)",
+    "2. 성별",
+    "3. 직업 (선택사항)",
+    "4. 거주 지역 (선택사항)",
+    "",
+    '예: "35세 여성, 간호사, 서울 거주" 또는 "40대 남성"',
+])
+
+# 이미지 분석 완료 메시지 템플릿 (분석 이벤트마다 한 번만 format)
+ANALYSIS_TEMPLATE = "\n".join([
+    "🔍 이미지 분석이 완료되었습니다!",
+    "",
+    "**MedBLIP 분석 결과:**",
+    "{result}",
+    "",
+    "이제 수집된 모든 정보를 종합하여",
+    "전문 의료진 Multi-Agent 상담으로 연결해드리겠습니다.",
+])
+
 
 class AdminWorkflow:
     """Admin Agent의 intake 워크플로우를 관리하는 클래스"""
 
-    def __init__(self, medblip_tool: Optional[MedBLIPTool] = None):
-        self.medblip_tool = medblip_tool or MedBLIPTool()
+    def __init__(self, medblip_tool: Optional[MedBLIPTool] = None,
+                 medblip_tool_factory: Optional[Callable[[], MedBLIPTool]] = None):
+        # MedBLIP 모델은 이미지 분석 단계에서 처음 필요할 때 로드
+        # (factory를 주면 프로세스 공유 인스턴스를 받아 세션마다 다시 로드하지 않음)
+        self._medblip_tool = medblip_tool
+        self._medblip_tool_factory = medblip_tool_factory
         self.workflow = self._create_workflow()
 
+    @property
+    def medblip_tool(self) -> MedBLIPTool:
+        """MedBLIP 도구 (첫 접근 시 생성하여 모델 로딩을 지연)"""
+        if self._medblip_tool is None:
+            if self._medblip_tool_factory is None:
+                from app.tools.medblip_tool import get_shared_medblip_tool
+                self._medblip_tool_factory = get_shared_medblip_tool
+            self._medblip_tool = self._medblip_tool_factory()
+        return self._medblip_tool
+
     def _create_workflow(self) -> StateGraph:
         """LangGraph 워크플로우 생성"""
         workflow = StateGraph(SharedMedicalState)
@@ -125,29 +183,9 @@ class AdminWorkflow:
         )
 
         if not greeting_exists:
-            greeting_message = """
-            안녕하세요! 🏥 Multi-Agent 의료 상담 서비스입니다.
-
-            저는 Admin Agent로, 여러분의 의료 상담을 위한 정보를 수집하겠습니다.
-
-            📋 진행 과정:
-            1. 기본 정보 수집 (인구학적 정보)
-            2. 과거 병력 및 가족력
-            3. 현재 증상 상세 문진
-            4. 복용 중인 약물 정보
-            5. 방사선 이미지 분석 (선택사항)
-            6. 전문 의료진 Multi-Agent 상담으로 연결
-
-            ⚠️ 본 서비스는 교육 및 참고 목적이며,
-            확정적 진단이나 치료를 제공하지 않습니다.
-            응급상황에서는 즉시 응급실을 방문하시기 바랍니다.
-
-            편안하게 말씀해 주세요. 시작하겠습니다!
-            """
-
             state.setdefault("messages", []).append({
                 "role": "assistant",
-                "content": greeting_message.strip(),
+                "content": GREETING_MESSAGE,
                 "stage": "greeting"
             })
 
@@ -161,20 +199,9 @@ class AdminWorkflow:
         demographics = state.get("demographics", {})
         # 사용자 입력이 아직 없으면 질문 표시
         if not demographics.get("raw_input"):
-            question = """
-            기본 정보를 알려주세요:
-
-            1. 나이 (또는 연령대)
-            2. 성별
-            3. 직업 (선택사항)
-            4. 거주 지역 (선택사항)
-
-            예: "35세 여성, 간호사, 서울 거주" 또는 "40대 남성"
-            """
-
             state["messages"].append({
                 "role": "assistant",
-                "content": question.strip(),
+                "content": DEMOGRAPHICS_QUESTION,
                 "stage": "demographics"
             })
             state["current_stage"] = "demographics"
@@ -316,10 +343,21 @@ class AdminWorkflow:
         if (state.get("uploaded_image") and
                 not state.get("medblip_findings")):
             try:
-                # MedBLIP 분석 수행
-                analysis_result = self.medblip_tool.analyze_medical_image(
-                    state["uploaded_image"]
-                )
+                # MedBLIP 분석 수행 (여러 장은 한 번의 배치로 분석)
+                uploaded = state["uploaded_image"]
+                if isinstance(uploaded, list):
+                    results = self.medblip_tool.analyze_medical_images(uploaded)
+                    if len(results) == 1:
+                        analysis_result = results[0]
+                    else:
+                        analysis_result = "\n".join(
+                            f"[이미지 {i}] {result}"
+                            for i, result in enumerate(results, 1)
+                        )
+                else:
+                    analysis_result = self.medblip_tool.analyze_medical_image(
+                        uploaded
+                    )
 
                 # AGENTS.md 명세에 따른 구조화된 findings
                 medblip_findings = {
@@ -331,19 +369,13 @@ class AdminWorkflow:
                 state["medblip_findings"] = medblip_findings
                 state["current_stage"] = "image_analysis"
 
-                analysis_message = f"""
-                🔍 이미지 분석이 완료되었습니다!
-
-                **MedBLIP 분석 결과:**
-                {analysis_result}
-
-                이제 수집된 모든 정보를 종합하여
-                전문 의료진 Multi-Agent 상담으로 연결해드리겠습니다.
-                """
+                analysis_message = ANALYSIS_TEMPLATE.format(
+                    result=analysis_result
+                )
 
                 state["messages"].append({
                     "role": "assistant",
-                    "content": analysis_message.strip(),
+                    "content": analysis_message,
                     "stage": "image_analysis"
                 })
 
@@ -1,20 +1,95 @@
 import os
-from typing import Dict, Any, Optional
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from langchain.chat_models.base import BaseChatModel
-from langchain_openai import ChatOpenAI
 
+from app.core.llm_utils import get_chat_model
 from .prompts.prompt import ORCHESTRATOR_AGENT_PROMPT, RADIOLOGY_ANALYSIS_PROMPT
 
 
+_SPEAKER_LABELS = {"user": "사용자", "assistant": "의료진"}
+
+# Most recent turns kept for the prompt; older ones drop off so prompt size stays bounded
+MAX_HISTORY_TURNS = 20
+
+# "FIELD: value" lines of the orchestrator response (decision/reason/message/context)
+_RESPONSE_FIELD_RE = re.compile(r"^(DECISION|REASON|MESSAGE|CONTEXT):(.*)$", re.MULTILINE)
+
+# Keyword patterns for _extract_medical_info. Korean keywords are matched as substrings
+# ("30살", "아프고"), so each category is one alternation scanned once per message.
+_AGE_RE = re.compile("살|세|년생|나이")
+_SYMPTOM_RE = re.compile("아프|통증|불편|증상")
+_HISTORY_RE = re.compile("병원|치료|수술|진단")
+
+
+# Most recent symptom mentions kept in the collected info (and thus in the prompt)
+MAX_SYMPTOM_ENTRIES = 8
+
+
+@dataclass
+class CollectedInfo:
+    """대화에서 수집한 의료 정보 (증상은 최근 MAX_SYMPTOM_ENTRIES개만 유지)"""
+    age_mentioned: bool = False
+    medical_history_mentioned: bool = False
+    symptoms: deque = field(default_factory=lambda: deque(maxlen=MAX_SYMPTOM_ENTRIES))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """수집된 항목만 담은 dict (프롬프트 및 반환값용)"""
+        info: Dict[str, Any] = {}
+        if self.age_mentioned:
+            info["age_mentioned"] = True
+        if self.symptoms:
+            info["symptoms"] = list(self.symptoms)
+        if self.medical_history_mentioned:
+            info["medical_history_mentioned"] = True
+        return info
+
+    def __str__(self) -> str:
+        return str(self.as_dict())
+
+
+def format_history(turns: List[Dict[str, str]]) -> str:
+    """구조화된 대화 턴을 프롬프트용 히스토리 문자열로 변환"""
+    return "".join(
+        f"\n{_SPEAKER_LABELS[turn['role']]}: {turn['content']}" for turn in turns
+    )
+
+
+@lru_cache(maxsize=128)
+def _offline_decision(stage: str, has_image: bool) -> Tuple[str, str, str]:
+    """오프라인 흐름의 (decision, reason, message) 결정 - 입력이 같으면 결과도 같으므로 메모이즈"""
+    if stage == "greeting":
+        return (
+            "COLLECT_BASIC_INFO",
+            "Collect minimal info",
+            "안녕하세요! MedBLIP 기반 의료 상담 서비스입니다. "
+            "간단한 정보를 알려주시고 이미지를 업로드해 주세요.",
+        )
+    if stage == "basic_info":
+        return (
+            "REQUEST_IMAGE",
+            "Proceed to image upload",
+            "감사합니다. 이제 방사선 이미지를 업로드해주세요.",
+        )
+    if stage in ("image_upload", "analysis") and has_image:
+        return (
+            "PROVIDE_EXPLANATION",
+            "Explain findings",
+            "이미지 분석을 완료하고 설명을 제공하겠습니다.",
+        )
+    return ("REQUEST_IMAGE", "Await image", "이미지를 업로드해 주세요.")
+
+
 class OrchestratorAgent:
     def __init__(self, llm: Optional[BaseChatModel] = None):
         if llm is None:
             api_key = os.getenv("OPENAI_API_KEY")
             if api_key:
-                self.llm = ChatOpenAI(
-                    api_key=api_key,
-                    model=os.getenv("OPENAI_MODEL", "gpt-3.5-turbo"),
-                    temperature=0.7,
+                self.llm = get_chat_model(
+                    api_key, os.getenv("OPENAI_MODEL", "gpt-3.5-turbo"), 0.7
                 )
             else:
                 self.llm = None
@@ -23,11 +98,18 @@ class OrchestratorAgent:
             
         self.orchestrator_prompt = ORCHESTRATOR_AGENT_PROMPT
         self.radiology_prompt = RADIOLOGY_ANALYSIS_PROMPT
+        # Compose the prompt | llm chains once instead of on every call
+        if self.llm is not None:
+            self._orchestrator_chain = self.orchestrator_prompt | self.llm
+            self._radiology_chain = self.radiology_prompt | self.llm
+        else:
+            self._orchestrator_chain = None
+            self._radiology_chain = None
         self.conversation_state = {
             "conversation_stage": "greeting",
-            "collected_info": {},
+            "collected_info": CollectedInfo(),
             "has_image": False,
-            "conversation_history": "",
+            "conversation_history": deque(maxlen=MAX_HISTORY_TURNS),
             "decision": None,
             "reason": None,
             "context": None
@@ -35,24 +117,17 @@ class OrchestratorAgent:
     
     def _parse_response(self, response: str) -> Dict[str, Any]:
         """AI 응답을 파싱하여 결정사항과 메시지를 추출"""
-        lines = response.strip().split('\n')
         parsed = {
             "decision": None,
             "reason": None,
             "message": response,
             "context": None
         }
-        
-        for line in lines:
-            if line.startswith("DECISION:"):
-                parsed["decision"] = line.replace("DECISION:", "").strip()
-            elif line.startswith("REASON:"):
-                parsed["reason"] = line.replace("REASON:", "").strip()
-            elif line.startswith("MESSAGE:"):
-                parsed["message"] = line.replace("MESSAGE:", "").strip()
-            elif line.startswith("CONTEXT:"):
-                parsed["context"] = line.replace("CONTEXT:", "").strip()
-        
+
+        # One pass over the response; a repeated field keeps its last value
+        for match in _RESPONSE_FIELD_RE.finditer(response.strip()):
+            parsed[match.group(1).lower()] = match.group(2).strip()
+
         return parsed
     
     def _update_conversation_stage(self, decision: str) -> str:
@@ -65,31 +140,30 @@ class OrchestratorAgent:
         }
         return stage_mapping.get(decision, "basic_info")
     
-    def _extract_medical_info(self, user_input: str, current_info: Dict[str, Any]) -> Dict[str, Any]:
-        """사용자 입력에서 의료 정보 추출 및 업데이트"""
+    def _extract_medical_info(self, user_input: str, current_info: CollectedInfo) -> CollectedInfo:
+        """사용자 입력에서 의료 정보 추출 및 업데이트 (current_info를 그대로 갱신)"""
         # 실제 구현에서는 더 정교한 NLP 기법을 사용할 수 있음
-        updated_info = current_info.copy()
-        
+
         # 나이 정보 추출
-        if any(keyword in user_input for keyword in ["살", "세", "년생", "나이"]):
-            updated_info["age_mentioned"] = True
-        
+        if _AGE_RE.search(user_input):
+            current_info.age_mentioned = True
+
         # 증상 정보 추출
-        if any(keyword in user_input for keyword in ["아프", "통증", "불편", "증상"]):
-            if "symptoms" not in updated_info:
-                updated_info["symptoms"] = []
-            updated_info["symptoms"].append(user_input)
-        
+        if _SYMPTOM_RE.search(user_input):
+            current_info.symptoms.append(user_input)
+
         # 과거 병력 추출
-        if any(keyword in user_input for keyword in ["병원", "치료", "수술", "진단"]):
-            updated_info["medical_history_mentioned"] = True
-        
-        return updated_info
+        if _HISTORY_RE.search(user_input):
+            current_info.medical_history_mentioned = True
+
+        return current_info
     
     def process_conversation(self, user_input: str, has_image: bool = False) -> Dict[str, Any]:
         """Main conversation processing function"""
-        # Update conversation history
-        self.conversation_state["conversation_history"] += f"\n사용자: {user_input}"
+        # Update conversation history (structured turns; formatted only for the prompt)
+        self.conversation_state["conversation_history"].append(
+            {"role": "user", "content": user_input}
+        )
         
         # Extract medical information
         self.conversation_state["collected_info"] = self._extract_medical_info(
@@ -101,51 +175,30 @@ class OrchestratorAgent:
             self.conversation_state["has_image"] = True
         
         # Execute prompt (online) or use offline guidance
-        if self.llm is not None:
-            chain = self.orchestrator_prompt | self.llm
-            response = chain.invoke({
+        if self._orchestrator_chain is not None:
+            response = self._orchestrator_chain.invoke({
                 "user_input": user_input,
                 "conversation_stage": self.conversation_state["conversation_stage"],
                 "collected_info": str(self.conversation_state["collected_info"]),
                 "has_image": self.conversation_state["has_image"],
-                "conversation_history": self.conversation_state["conversation_history"],
+                "conversation_history": format_history(
+                    self.conversation_state["conversation_history"]
+                ),
             })
             parsed_response = self._parse_response(response.content)
         else:
             # Minimal offline flow
-            stage = self.conversation_state["conversation_stage"]
-            if stage == "greeting":
-                parsed_response = {
-                    "decision": "COLLECT_BASIC_INFO",
-                    "reason": "Collect minimal info",
-                    "message": (
-                        "안녕하세요! MedBLIP 기반 의료 상담 서비스입니다. "
-                        "간단한 정보를 알려주시고 이미지를 업로드해 주세요."
-                    ),
-                    "context": None,
-                }
-            elif stage == "basic_info":
-                parsed_response = {
-                    "decision": "REQUEST_IMAGE",
-                    "reason": "Proceed to image upload",
-                    "message": "감사합니다. 이제 방사선 이미지를 업로드해주세요.",
-                    "context": None,
-                }
-            elif stage in ("image_upload", "analysis") and self.conversation_state["has_image"]:
-                parsed_response = {
-                    "decision": "PROVIDE_EXPLANATION",
-                    "reason": "Explain findings",
-                    "message": "이미지 분석을 완료하고 설명을 제공하겠습니다.",
-                    "context": None,
-                }
-            else:
-                parsed_response = {
-                    "decision": "REQUEST_IMAGE",
-                    "reason": "Await image",
-                    "message": "이미지를 업로드해 주세요.",
-                    "context": None,
-                }
-        
+            decision, reason, message = _offline_decision(
+                self.conversation_state["conversation_stage"],
+                self.conversation_state["has_image"],
+            )
+            parsed_response = {
+                "decision": decision,
+                "reason": reason,
+                "message": message,
+                "context": None,
+            }
+
         # Update state
         if parsed_response["decision"]:
             self.conversation_state["decision"] = parsed_response["decision"]
@@ -156,7 +209,9 @@ class OrchestratorAgent:
             )
         
         # Add AI response to conversation history
-        self.conversation_state["conversation_history"] += f"\n의료진: {parsed_response['message']}"
+        self.conversation_state["conversation_history"].append(
+            {"role": "assistant", "content": parsed_response["message"]}
+        )
         
         return {
             "message": parsed_response["message"],
@@ -164,18 +219,17 @@ class OrchestratorAgent:
             "reason": parsed_response["reason"],
             "context": parsed_response["context"],
             "conversation_stage": self.conversation_state["conversation_stage"],
-            "collected_info": self.conversation_state["collected_info"],
+            "collected_info": self.conversation_state["collected_info"].as_dict(),
         }
     
     def analyze_radiology_image(self, image_analysis: str, symptoms: str = "", basic_info: str = "", medical_history: str = "") -> str:
         """Analyze radiological image and provide patient-friendly explanation"""
-        if self.llm is None:
+        if self._radiology_chain is None:
             return (
                 f"이미지 분석 결과: {image_analysis}\n"
                 "자세한 설명은 의료진 상담을 권장드립니다."
             )
-        chain = self.radiology_prompt | self.llm
-        response = chain.invoke(
+        response = self._radiology_chain.invoke(
             {
                 "image_analysis": image_analysis,
                 "symptoms": symptoms,
@@ -189,9 +243,9 @@ class OrchestratorAgent:
         """Reset conversation state"""
         self.conversation_state = {
             "conversation_stage": "greeting",
-            "collected_info": {},
+            "collected_info": CollectedInfo(),
             "has_image": False,
-            "conversation_history": "",
+            "conversation_history": deque(maxlen=MAX_HISTORY_TURNS),
             "decision": None,
             "reason": None,
             "context": None
@@ -201,7 +255,7 @@ class OrchestratorAgent:
         """Return current conversation summary"""
         return {
             "stage": self.conversation_state["conversation_stage"],
-            "collected_info": self.conversation_state["collected_info"],
+            "collected_info": self.conversation_state["collected_info"].as_dict(),
             "has_image": self.conversation_state["has_image"],
             "last_decision": self.conversation_state["decision"],
         }
@@ -117,6 +117,10 @@ class ConversationManager:
         st.terminated = True
         st.termination_reason = reason
 
+    def discard_session(self, session_id: str) -> None:
+        """Forget a session once its result has been handed off (no retained history)."""
+        self._sessions.pop(session_id, None)
+
     # -- Round operations --
     def begin_round(self, session_id: str) -> int:
         st = self._require_session(session_id)
@@ -13,13 +13,12 @@ import os
 import logging
 from typing import Dict, Any, List, Optional
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
 
+from app.core.llm_utils import get_chat_model
 from app.agents.conversation_manager import CaseContext, DoctorOpinion
 from app.agents.prompts.doctor_prompts import (
     DOCTOR_ANALYSIS_PROMPT,
-    DOCTOR_CRITIQUE_PROMPT,
-    DOCTOR_REASONING_PROMPT
+    DOCTOR_CRITIQUE_PROMPT
 )
 
 logger = logging.getLogger(__name__)
@@ -49,10 +48,10 @@ class DoctorAgent:
 
         # LLM 초기화
         logger.info(f"🔑 {doctor_id} OpenAI LLM 초기화 중")
-        self.llm = ChatOpenAI(
-            api_key=self.api_key,
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.7  # 창의적 추론을 위해 적당한 온도
+        self.llm = get_chat_model(
+            self.api_key,
+            os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+            0.7  # 창의적 추론을 위해 적당한 온도
         )
 
         # 의사별 히스토리 (라운드별 의견 기록)
@@ -261,7 +260,7 @@ class DoctorAgent:
         """
 
         # 동료 의견들
-        peer_section = "\n**Other Doctor's Opinion:**\n"
+        peer_parts = ["\n**Other Doctor's Opinion:**\n"]
         logger.info(f"🔍 [{self.doctor_id}] 동료 의견 필터링 중...")
         logger.info(f"🔍 [{self.doctor_id}] self.doctor_id: '{self.doctor_id}'")
         logger.info(f"🔍 [{self.doctor_id}] peer_opinions.keys(): {list(peer_opinions.keys())}")
@@ -269,14 +268,15 @@ class DoctorAgent:
         for doctor_id, opinion in peer_opinions.items():
             logger.info(f"🔍 [{self.doctor_id}] 비교 중: doctor_id='{doctor_id}' vs self.doctor_id='{self.doctor_id}' -> 같음={doctor_id == self.doctor_id}")
             if doctor_id != self.doctor_id:  # 자신의 의견 제외
-                peer_section += f"""
+                peer_parts.append(f"""
         {doctor_id}:
         - hypotheses: {opinion.get('hypotheses', [])}
         - diagnostic_tests: {opinion.get('diagnostic_tests', [])}
         - reasoning: {opinion.get('reasoning', '')}
-        """
+        """)
             else:
                 logger.info(f"🔍 [{self.doctor_id}] ✅ 자신의 의견 제외됨: {doctor_id}")
+        peer_section = "".join(peer_parts)
 
         # Supervisor 피드백
         feedback_section = ""
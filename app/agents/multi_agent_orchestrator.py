@@ -9,7 +9,7 @@ LangGraph 기반으로 Admin, Doctor, Supervisor Agent를 조율하는 메인 
 
 from __future__ import annotations
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Optional
 from langgraph.graph import StateGraph, START, END
 
 from app.agents.shared_state import (
@@ -24,7 +24,7 @@ from app.agents.shared_state import (
 from app.agents.admin_agent import AdminAgent
 from app.agents.doctor_agent import DoctorAgent
 from app.agents.supervisor_agent import SupervisorAgent
-from app.tools.medblip_tool import MedBLIPTool
+from app.tools.medblip_tool import get_shared_medblip_tool
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +48,7 @@ class MultiAgentOrchestrator:
             DoctorAgent(doctor_id="doctor_3", openai_api_key=openai_api_key)
         ]
         self.supervisor_agent = SupervisorAgent(openai_api_key)
-        self.medblip_tool = MedBLIPTool()
+        self.medblip_tool = get_shared_medblip_tool()
 
         # LangGraph 워크플로우 생성
         self.workflow = self._create_workflow()
@@ -10,10 +10,13 @@ Prompts according to AGENTS.md specification:
 - Include self-critique loop and safety constraints
 """
 
+# Doctor-specific text ({doctor_id}) is kept at the end of these system prompts so the
+# three doctors' requests share an identical prefix (provider-side prompt caching).
+
 # Doctor Analysis Prompt (Initial Round)
 DOCTOR_ANALYSIS_PROMPT = """
 [Role]
-You are General Practitioner {doctor_id}.
+You are a General Practitioner on a panel of doctors.
 As a member of the medical AI multi-agent system, you provide comprehensive medical analysis of patient cases.
 
 [Goals]
@@ -68,12 +71,15 @@ Respond in the following structure:
 - Confidence Level: [Degree of confidence for each hypothesis]
 - Limiting Factors: [Limitations of analysis]
 - Additional Review: [Areas requiring further review]
+
+[Identity]
+You are General Practitioner {doctor_id}.
 """
 
 # Doctor Critique and Update Prompt (Follow-up Rounds)
 DOCTOR_CRITIQUE_PROMPT = """
 [Role]
-You are General Practitioner {doctor_id}.
+You are a General Practitioner on a panel of doctors.
 In round {round_number}, you are reviewing colleague doctors' opinions and updating your own opinion.
 
 [Goals]
@@ -141,6 +147,9 @@ Respond in the following structure:
 - Key Message: [Most important point]
 - Patient Safety: [Major safety-related considerations]
 - Recommendations: [Final recommendation]
+
+[Identity]
+You are General Practitioner {doctor_id}.
 """
 
 # Doctor Enhanced Reasoning Prompt
@@ -10,8 +10,6 @@ Prompts according to AGENTS.md specification:
 - Emphasis on critique, uncertainty handling, and termination conditions
 """
 
-from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
-
 # Supervisor Orchestration Prompt
 SUPERVISOR_ORCHESTRATION_PROMPT = """
 [Role]
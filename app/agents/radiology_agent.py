@@ -5,6 +5,7 @@ Radiological Image Analysis Agent for minimal scenario
 
 import os
 from typing import Dict, Any
+from app.core.llm_utils import get_chat_model
 from .prompts.prompt import RADIOLOGY_ANALYSIS_PROMPT
 
 try:
@@ -14,6 +15,27 @@ except Exception:  # pragma: no cover - optional dependency path
     ChatOpenAI = None  # type: ignore
 
 
+# Imaging method explanations (built once at import, not on every call)
+_IMAGING_EXPLANATIONS = {
+    "X-ray": """
+X-ray 검사는 가장 기본적인 영상 검사 중 하나입니다.
+
+**검사 방법:**
+- X선을 몸에 투과시켜 뼈와 폐 등의 구조를 영상으로 만드는 검사입니다
+- 검사 시간은 보통 5-10분 정도로 매우 짧습니다
+- 방사선 노출량은 매우 적어 안전합니다
+
+**무엇을 볼 수 있나요:**
+- 뼈의 골절이나 변형
+- 폐의 염증이나 이상 소견
+- 심장의 크기나 모양
+- 복부 장기의 전반적인 상태
+    """,
+    "CT": "CT 스캔은 X선을 이용해 몸의 단면 영상을 만드는 정밀한 검사입니다.",
+    "MRI": "MRI는 자기장을 이용해 몸 속 연조직을 자세히 볼 수 있는 검사입니다."
+}
+
+
 class RadiologyAnalysisAgent:
     """Specialized agent for medical consultation using finetuned MedBLIP results.
 
@@ -28,14 +50,13 @@ class RadiologyAnalysisAgent:
         if api_key and ChatOpenAI is not None:
             # Prefer lighter model by default unless overridden via env
             model_name = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
-            self.llm = ChatOpenAI(
-                api_key=api_key,
-                model=model_name,
-                temperature=0.3,
-            )
+            self.llm = get_chat_model(api_key, model_name, 0.3)
+            # Compose the chain once instead of on every consultation
+            self.chain = self.prompt | self.llm
         else:
             self.llm = None
-    
+            self.chain = None
+
     def provide_medical_consultation(self, medblip_result: str, patient_info: Dict[str, Any]) -> str:
         """
         Provide medical consultation based on finetuned MedBLIP analysis results
@@ -54,9 +75,8 @@ class RadiologyAnalysisAgent:
         medical_history = patient_info.get("medical_history", "특별한 병력 없음")
         
         # Online path
-        if self.llm is not None:
-            chain = self.prompt | self.llm
-            response = chain.invoke({
+        if self.chain is not None:
+            response = self.chain.invoke({
                 "image_analysis": medblip_result,
                 "symptoms": symptoms,
                 "basic_info": basic_info,
@@ -82,23 +102,4 @@ class RadiologyAnalysisAgent:
     
     def get_imaging_method_explanation(self, image_type: str = "X-ray") -> str:
         """Provide simple explanation of imaging method"""
-        explanations = {
-            "X-ray": """
-X-ray 검사는 가장 기본적인 영상 검사 중 하나입니다.
-
-**검사 방법:**
-- X선을 몸에 투과시켜 뼈와 폐 등의 구조를 영상으로 만드는 검사입니다
-- 검사 시간은 보통 5-10분 정도로 매우 짧습니다
-- 방사선 노출량은 매우 적어 안전합니다
-
-**무엇을 볼 수 있나요:**
-- 뼈의 골절이나 변형
-- 폐의 염증이나 이상 소견
-- 심장의 크기나 모양
-- 복부 장기의 전반적인 상태
-            """,
-            "CT": "CT 스캔은 X선을 이용해 몸의 단면 영상을 만드는 정밀한 검사입니다.",
-            "MRI": "MRI는 자기장을 이용해 몸 속 연조직을 자세히 볼 수 있는 검사입니다."
-        }
-        
-        return explanations.get(image_type, explanations["X-ray"])
+        return _IMAGING_EXPLANATIONS.get(image_type, _IMAGING_EXPLANATIONS["X-ray"])
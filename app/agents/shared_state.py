@@ -8,9 +8,9 @@ Admin, Doctor, Supervisor Agent가 모두 이 상태를 읽고 쓸 수 있습니
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List, Optional, TypedDict
+from typing import Dict, Any, List, Optional, TypedDict, Union
 from PIL import Image
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
 # 기본 정보 구조
@@ -128,7 +128,7 @@ class SharedMedicalState(TypedDict, total=False):
     stage_completed: Dict[str, bool]
 
     # 이미지 관련
-    uploaded_image: Optional[Image.Image]
+    uploaded_image: Optional[Union[Image.Image, List[Image.Image]]]
     image_processed: bool
 
     # 멀티 에이전트 라운드 관리
@@ -11,22 +11,24 @@ AGENTS.md 명세에 따른 역할:
 
 import os
 import logging
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
 
+from app.core.llm_utils import get_chat_model
 from app.agents.conversation_manager import (
     CaseContext, DoctorOpinion, SupervisorDecision,
     ConversationManager, SessionState
 )
 from app.agents.prompts.supervisor_prompts import (
-    SUPERVISOR_ORCHESTRATION_PROMPT,
-    SUPERVISOR_CONSENSUS_PROMPT,
-    SUPERVISOR_CRITIQUE_PROMPT
+    SUPERVISOR_CONSENSUS_PROMPT
 )
 
 logger = logging.getLogger(__name__)
 
+# 프롬프트에 포함할 이전 라운드 수 (라운드가 늘어도 프롬프트 길이가 일정하게 유지됨)
+PREVIOUS_ROUNDS_WINDOW = 5
+
 
 class SupervisorAgent:
     """
@@ -38,9 +40,12 @@ class SupervisorAgent:
     - 합의에 도달하면 조기 종료
     """
 
-    def __init__(self, openai_api_key: Optional[str] = None):
+    def __init__(self, openai_api_key: Optional[str] = None, parallel_doctors: bool = True):
         logger.info("🎯 SupervisorAgent 초기화 시작")
 
+        # 라운드 내 Doctor 의견은 서로 독립적이므로 기본적으로 동시에 수집
+        self.parallel_doctors = parallel_doctors
+
         self.api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
 
         if not self.api_key:
@@ -48,10 +53,10 @@ class SupervisorAgent:
 
         # LLM 초기화
         logger.info("🔑 OpenAI LLM 초기화 중")
-        self.llm = ChatOpenAI(
-            api_key=self.api_key,
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.3  # 일관성을 위해 낮은 온도
+        self.llm = get_chat_model(
+            self.api_key,
+            os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+            0.3  # 일관성을 위해 낮은 온도
         )
 
         # ConversationManager 초기화 (7라운드로 변경)
@@ -74,6 +79,22 @@ class SupervisorAgent:
         Returns:
             심의 결과 딕셔너리
         """
+        result: Dict[str, Any] = {}
+        for update in self.start_deliberation_stream(session_id, case_context, doctors):
+            result = update.get("result", result)
+        return result
+
+    def start_deliberation_stream(self,
+                                  session_id: str,
+                                  case_context: CaseContext,
+                                  doctors: List['DoctorAgent']) -> Iterator[Dict[str, Any]]:
+        """
+        start_deliberation과 같은 심의를 라운드 단위로 진행 상황을 내보내며 수행
+
+        Yields:
+            라운드마다 {"round", "max_rounds", "decision"} 딕셔너리,
+            마지막에 {"round", "max_rounds", "result"} (심의 결과 딕셔너리)
+        """
         logger.info(f"🚀 심의 시작 - 세션: {session_id}")
 
         if len(doctors) != 3:
@@ -109,17 +130,32 @@ class SupervisorAgent:
                 # 세션 상태 업데이트
                 session_state = self.conversation_manager.get_session(session_id)
 
+                yield {
+                    "round": round_number,
+                    "max_rounds": session_state.max_rounds,
+                    "decision": supervisor_decision,
+                }
+
             if not session_state.terminated:
                 logger.info("⏰ 7라운드 완료 - 심의 종료")
                 self.conversation_manager.end_session(session_id, "7라운드 완료")
 
-            return self._format_deliberation_result(session_id)
+            yield {
+                "round": session_state.current_round,
+                "max_rounds": session_state.max_rounds,
+                "result": self._format_deliberation_result(session_id),
+            }
 
         except Exception as e:
             logger.error(f"❌ 심의 중 오류: {str(e)}")
             self.conversation_manager.end_session(session_id, f"오류: {str(e)}")
             raise
 
+        finally:
+            # Supervisor는 프로세스 전체에서 공유되므로, 끝난(또는 중단된) 심의 기록을
+            # 남겨두지 않음 - 세션이 끝나도 환자 데이터가 메모리에 쌓이지 않도록 함
+            self.conversation_manager.discard_session(session_id)
+
     def _collect_doctor_opinions(self,
                                 session_id: str,
                                 case_context: CaseContext,
@@ -134,21 +170,40 @@ class SupervisorAgent:
         session_state = self.conversation_manager.get_session(session_id)
         previous_opinions = self._get_previous_round_opinions(session_state, round_number)
 
-        for i, doctor in enumerate(doctors):
-            doctor_id = f"doctor_{i+1}"
+        supervisor_feedback = self._get_supervisor_feedback(session_state, round_number)
+        doctor_ids = [f"doctor_{i+1}" for i in range(len(doctors))]
+
+        def request_opinion(doctor_id: str, doctor: 'DoctorAgent') -> DoctorOpinion:
             logger.info(f"🩺 {doctor_id} 의견 수집 중...")
 
             # Debug: Log peer_opinions keys being passed to this doctor
             logger.info(f"🔍 [{doctor_id}] peer_opinions keys: {list(previous_opinions.keys())}")
             logger.info(f"🔍 [{doctor_id}] doctor.doctor_id: {doctor.doctor_id}")
 
+            return doctor.provide_opinion(
+                case_context=case_context,
+                round_number=round_number,
+                peer_opinions=previous_opinions,
+                supervisor_feedback=supervisor_feedback
+            )
+
+        # LLM 호출은 I/O 대기이므로 스레드로 동시에 실행 (라운드 지연 = 가장 느린 Doctor)
+        if self.parallel_doctors and len(doctors) > 1:
+            with ThreadPoolExecutor(max_workers=len(doctors)) as pool:
+                futures = [
+                    pool.submit(request_opinion, doctor_id, doctor)
+                    for doctor_id, doctor in zip(doctor_ids, doctors)
+                ]
+        else:
+            futures = None
+
+        # 결과 저장은 원래 순서대로 현재 스레드에서 수행
+        for i, (doctor_id, doctor) in enumerate(zip(doctor_ids, doctors)):
             try:
-                opinion = doctor.provide_opinion(
-                    case_context=case_context,
-                    round_number=round_number,
-                    peer_opinions=previous_opinions,
-                    supervisor_feedback=self._get_supervisor_feedback(session_state, round_number)
-                )
+                if futures is not None:
+                    opinion = futures[i].result()
+                else:
+                    opinion = request_opinion(doctor_id, doctor)
 
                 # 의견 검증 및 저장
                 self.conversation_manager.add_doctor_opinion(session_id, doctor_id, opinion)
@@ -244,15 +299,16 @@ class SupervisorAgent:
         """
 
         # Doctor 의견 요약
-        opinions_summary = f"\n라운드 {round_number} Doctor 의견들:\n"
-        for doctor_id, opinion in doctor_opinions.items():
-            opinions_summary += f"""
+        opinions_summary = f"\n라운드 {round_number} Doctor 의견들:\n" + "".join(
+            f"""
         {doctor_id}:
         - 가설: {opinion.get('hypotheses', [])}
         - 진단 검사: {opinion.get('diagnostic_tests', [])}
         - 근거: {opinion.get('reasoning', '')}
         - 동료 의견에 대한 비판: {opinion.get('critique_of_peers', '')}
         """
+            for doctor_id, opinion in doctor_opinions.items()
+        )
 
         return f"""
         {case_summary}
@@ -342,21 +398,22 @@ class SupervisorAgent:
         if current_round <= 1 or not session_state or not session_state.rounds:
             return ""
 
-        context = f"\n이전 라운드들 요약 ({len(session_state.rounds)-1}라운드까지):\n"
+        parts = [f"\n이전 라운드들 요약 ({len(session_state.rounds)-1}라운드까지):\n"]
 
-        for round_record in session_state.rounds[:-1]:  # 현재 라운드 제외
-            context += f"\n라운드 {round_record.round_index}:\n"
+        # 현재 라운드 제외, 최근 PREVIOUS_ROUNDS_WINDOW개 라운드만 포함
+        for round_record in session_state.rounds[:-1][-PREVIOUS_ROUNDS_WINDOW:]:
+            parts.append(f"\n라운드 {round_record.round_index}:\n")
 
             # Doctor 의견들
             for doctor_id, opinion in round_record.doctor_opinions.items():
-                context += f"  {doctor_id}: {opinion.get('hypotheses', [])} | {opinion.get('diagnostic_tests', [])}\n"
+                parts.append(f"  {doctor_id}: {opinion.get('hypotheses', [])} | {opinion.get('diagnostic_tests', [])}\n")
 
             # Supervisor 결정
             if round_record.supervisor_decision:
                 decision = round_record.supervisor_decision
-                context += f"  Supervisor: {decision.get('consensus_hypotheses', [])} | 합의여부: {bool(decision.get('termination_reason'))}\n"
+                parts.append(f"  Supervisor: {decision.get('consensus_hypotheses', [])} | 합의여부: {bool(decision.get('termination_reason'))}\n")
 
-        return context
+        return "".join(parts)
 
     def _format_deliberation_result(self, session_id: str) -> Dict[str, Any]:
         """심의 결과 포맷팅"""
@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+LLM call helpers shared across agents.
+
+Pure helpers only; no Streamlit dependencies or side effects.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from langchain_openai import ChatOpenAI
+
+
+@lru_cache(maxsize=8)
+def get_chat_model(api_key: str, model: str, temperature: float) -> "ChatOpenAI":
+    """Return a process-wide ChatOpenAI client for this configuration.
+
+    Agents with the same settings (e.g. the three doctors) share one client and
+    its HTTP connection pool instead of each building their own.
+    """
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(api_key=api_key, model=model, temperature=temperature)
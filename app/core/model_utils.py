@@ -8,11 +8,15 @@ Pure helpers only; no Streamlit dependencies or side effects.
 
 from __future__ import annotations
 
+import importlib.util
+import logging
 import os
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
+import torch
 from transformers import BlipForConditionalGeneration, BlipProcessor
 
+logger = logging.getLogger(__name__)
 
 DEFAULT_MODEL_PATHS = (
     "./model",     # Local development
@@ -28,6 +32,119 @@ def find_model_path(paths: tuple[str, ...] = DEFAULT_MODEL_PATHS) -> Optional[st
     return None
 
 
+def _env_flag(name: str) -> bool:
+    """Return True when an environment flag is set to a truthy value."""
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def env_positive_int(name: str, default: int) -> int:
+    """Return a positive int from the environment, or default when unset or invalid."""
+    try:
+        return max(1, int(os.getenv(name, default)))
+    except ValueError:
+        return default
+
+
+def torch_compile_enabled() -> bool:
+    """Return True when MEDBLIP_TORCH_COMPILE is set to a truthy value."""
+    return _env_flag("MEDBLIP_TORCH_COMPILE")
+
+
+def _load_processor(resolved: str, local_files_only: bool) -> BlipProcessor:
+    """Prefer the fast (torchvision-backed) image processor, falling back to the slow one."""
+    try:
+        return BlipProcessor.from_pretrained(
+            resolved, local_files_only=local_files_only, use_fast=True
+        )
+    except Exception:
+        # torchvision not installed or fast processor unsupported
+        return BlipProcessor.from_pretrained(
+            resolved, local_files_only=local_files_only
+        )
+
+
+def _int8_requested() -> bool:
+    """Return True when MEDBLIP_QUANTIZE=int8 is set."""
+    return os.getenv("MEDBLIP_QUANTIZE", "").strip().lower() == "int8"
+
+
+def _int8_load_kwargs() -> Dict[str, Any]:
+    """from_pretrained kwargs for 8-bit GPU loading via bitsandbytes (empty if unavailable)."""
+    if not torch.cuda.is_available() or importlib.util.find_spec("bitsandbytes") is None:
+        return {}
+    from transformers import BitsAndBytesConfig
+
+    return {
+        "quantization_config": BitsAndBytesConfig(load_in_8bit=True),
+        "device_map": "auto",
+    }
+
+
+def _cuda_half_load_kwargs() -> Dict[str, Any]:
+    """from_pretrained kwargs loading the weights in bf16 (fp16 if unsupported) on CUDA."""
+    if not torch.cuda.is_available():
+        return {}
+    dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    return {"torch_dtype": dtype}
+
+
+def _weights_load_kwargs(resolved: str) -> Dict[str, Any]:
+    """from_pretrained kwargs for the fast weight-loading path.
+
+    safetensors is memory-mapped instead of unpickled, and low_cpu_mem_usage
+    fills an empty model shell instead of building a random-init copy first
+    (needs accelerate, so it is only passed when that is installed).
+    """
+    kwargs: Dict[str, Any] = {}
+    if any(
+        os.path.exists(os.path.join(resolved, name))
+        for name in ("model.safetensors", "model.safetensors.index.json")
+    ):
+        kwargs["use_safetensors"] = True
+    if importlib.util.find_spec("accelerate") is not None:
+        kwargs["low_cpu_mem_usage"] = True
+    return kwargs
+
+
+def _maybe_compile(model: BlipForConditionalGeneration) -> BlipForConditionalGeneration:
+    """Compile the vision encoder with torch.compile when MEDBLIP_TORCH_COMPILE is set.
+
+    Only the ViT encoder is compiled: its input shape is fixed (384x384), so it
+    compiles once, while the decoder's shape changes every generation step.
+    torch.compile is lazy, so a missing inductor/triton only fails on the first
+    forward; callers run a warmup and fall back with restore_eager_vision_model().
+    """
+    if not torch_compile_enabled() or not hasattr(torch, "compile"):
+        return model
+    try:
+        mode = "reduce-overhead" if torch.cuda.is_available() else "default"
+        model.vision_model = torch.compile(model.vision_model, mode=mode)
+    except Exception as e:
+        logger.warning(f"torch.compile unavailable, keeping the eager vision encoder: {e}")
+    return model
+
+
+def restore_eager_vision_model(model: BlipForConditionalGeneration) -> bool:
+    """Swap a compiled vision encoder back to its eager module; True if one was swapped."""
+    eager = getattr(model.vision_model, "_orig_mod", None)
+    if eager is None:
+        return False
+    model.vision_model = eager
+    return True
+
+
+def warmup_medblip_model(
+    model: BlipForConditionalGeneration,
+    device: str,
+    image_size: int = 384,
+) -> None:
+    """Run one tiny generate so lazy CUDA init / kernel selection / compilation
+    happen at load time instead of on the first user request."""
+    dummy = torch.zeros(1, 3, image_size, image_size, device=device, dtype=model.dtype)
+    with torch.inference_mode():
+        model.generate(pixel_values=dummy, max_new_tokens=5, use_cache=True)
+
+
 def load_medblip_model(
     *,
     model_path: Optional[str] = None,
@@ -42,12 +159,23 @@ def load_medblip_model(
         return None, None, None
 
     try:
+        quantize = _int8_requested()
+        load_kwargs = _int8_load_kwargs() if quantize else {}
+        if not load_kwargs:
+            # Half-precision weights on GPU: half the memory traffic, tensor-core matmuls
+            load_kwargs = _cuda_half_load_kwargs()
+        load_kwargs = {**_weights_load_kwargs(resolved), **load_kwargs}
         model = BlipForConditionalGeneration.from_pretrained(
-            resolved, local_files_only=local_files_only
-        )
-        processor = BlipProcessor.from_pretrained(
-            resolved, local_files_only=local_files_only
+            resolved, local_files_only=local_files_only, **load_kwargs
         )
+        model.eval()
+        if quantize and not torch.cuda.is_available():
+            # CPU: dynamic int8 quantization of the Linear layers (attention + FFN)
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        model = _maybe_compile(model)
+        processor = _load_processor(resolved, local_files_only)
         return model, processor, resolved
     except Exception:
         # Keep callers robust; they can handle None to show offline/demo paths
@@ -6,41 +6,98 @@ Medical AI Consultation Service - Minimal Radiological Image Analysis Scenario
 
 import streamlit as st
 import os
-from PIL import Image
+from PIL import Image, UnidentifiedImageError
 from dotenv import load_dotenv
 import logging
-from typing import Dict, Any
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib.enums import TA_LEFT, TA_CENTER
+from typing import Dict, Any, List, TYPE_CHECKING
 from datetime import datetime
+from functools import lru_cache
+from xml.sax.saxutils import escape
+import hashlib
 import io
+import json
+import re
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
+
+try:
+    # DICOM uploads (declared dependency; guarded so a broken install only disables .dcm)
+    import pydicom  # type: ignore
+    try:
+        from pydicom.pixels import apply_modality_lut, apply_voi_lut  # type: ignore
+        from pydicom.pixels import pixel_array as dicom_pixel_array  # type: ignore
+    except ImportError:  # pydicom < 3
+        from pydicom.pixel_data_handlers.util import apply_modality_lut, apply_voi_lut  # type: ignore
+        dicom_pixel_array = None  # type: ignore
+except Exception:  # pragma: no cover - optional dependency path
+    pydicom = None  # type: ignore
+
+if TYPE_CHECKING:
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import Paragraph
+
+
+@st.cache_resource
+def _bootstrap():
+    """Process-wide setup, run once instead of on every Streamlit rerun."""
+    # Load environment variables
+    load_dotenv()
+
+    # Enable LangChain verbose logging
+    os.environ["LANGCHAIN_VERBOSE"] = "true"
+    os.environ["LANGCHAIN_TRACING_V2"] = "false"
 
-# Load environment variables
-load_dotenv()
+    # Set up basic logging for agent outputs
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-# Enable LangChain verbose logging
-os.environ["LANGCHAIN_VERBOSE"] = "true"
-os.environ["LANGCHAIN_TRACING_V2"] = "false"
 
-# Set up basic logging for agent outputs
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_bootstrap()
 agent_logger = logging.getLogger("AGENT_OUTPUT")
+logger = logging.getLogger(__name__)
 
-from app.agents.admin_agent import AdminAgent
-from app.agents.supervisor_agent import SupervisorAgent
-from app.agents.doctor_agent import create_doctor_panel
+# Agent and MedBLIP modules (langchain, torch, transformers) are imported inside the
+# loaders below, so the first page renders before the heavy libraries load.
+# ReportLab is likewise imported inside the PDF helpers, only once a PDF is requested.
+
+
+def _create_medblip_tool():
+    """Build the MedBLIP tool and load its weights (no Streamlit calls; runs off-thread)."""
+    from app.tools.medblip_tool import get_shared_medblip_tool
+    tool = get_shared_medblip_tool()
+    tool.ensure_loaded()
+    return tool
+
+
+@st.cache_resource(show_spinner=False)
+def preload_medblip_tool() -> Future:
+    """Start loading the MedBLIP weights in the background (once per process).
+
+    Started on the first intake answer rather than on page load, so visitors who
+    never start a consultation do not load the model; the rest of intake comes
+    before the image step, so it is usually loaded by the time an image is uploaded.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="medblip-preload")
+    future = executor.submit(_create_medblip_tool)
+    executor.shutdown(wait=False)
+    return future
+
+
+def load_medblip_tool():
+    """MedBLIP tool shared by all sessions (waits for the background preload)."""
+    return preload_medblip_tool().result()
 
 
-@st.cache_resource
 def load_admin_agent():
-    """Load Admin Agent (cached)."""
+    """Create a per-session Admin Agent.
+
+    The agent itself is cheap (LLM clients are shared via get_chat_model); only the
+    MedBLIP weights are expensive, and those come from load_medblip_tool().
+    """
     try:
-        agent = AdminAgent()
+        from app.agents.admin_agent import AdminAgent
+        agent = AdminAgent(medblip_tool_factory=load_medblip_tool)
         st.success("🤖 Admin Agent 초기화 완료")
         return agent
     except Exception as e:
@@ -48,44 +105,135 @@ def load_admin_agent():
         return None
 
 
-@st.cache_resource
+def _create_supervisor_and_doctors():
+    """Build the Supervisor Agent and Doctor Panel (no Streamlit calls; runs off-thread)."""
+    from app.agents.supervisor_agent import SupervisorAgent
+    from app.agents.doctor_agent import create_doctor_panel
+    return SupervisorAgent(), create_doctor_panel()
+
+
+@st.cache_resource(show_spinner=False)
+def preload_supervisor_and_doctors() -> Future:
+    """Start building the supervisor/doctor panel in the background (once per process).
+
+    Intake takes minutes, so the panel is usually ready before deliberation starts.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-preload")
+    future = executor.submit(_create_supervisor_and_doctors)
+    executor.shutdown(wait=False)
+    return future
+
+
 def load_supervisor_and_doctors():
-    """Load Supervisor Agent and Doctor Panel (cached)."""
+    """Load Supervisor Agent and Doctor Panel (waits for the background preload)."""
     try:
-        supervisor = SupervisorAgent()
-        doctors = create_doctor_panel()
+        supervisor, doctors = preload_supervisor_and_doctors().result()
         st.success("🎯 Supervisor Agent와 Doctor Panel 초기화 완료")
         return supervisor, doctors
     except Exception as e:
         st.error(f"Multi-Agent 초기화 실패: {str(e)}")
+        # Drop the failed future so the next attempt rebuilds the panel
+        preload_supervisor_and_doctors.clear()
         return None, None
 
 
+@st.cache_resource
+def get_inference_executor():
+    """Single-worker executor for MedBLIP inference (cached).
+
+    한 번에 하나의 추론만 GPU 메모리를 사용하도록 worker는 1개로 제한합니다.
+    """
+    return ThreadPoolExecutor(max_workers=1)
+
+
+# Per-session defaults; callables are factories so mutable or unique values are fresh per session
+_SESSION_DEFAULTS = {
+    "admin_agent": None,
+    "supervisor_agent": None,
+    "doctor_agents": None,
+    "messages": list,
+    # Number of Admin Agent log messages already mirrored into "messages"
+    "msg_cursor": 0,
+    "current_stage": "greeting",
+    "conversation_complete": False,
+    "handoff_data": dict,
+    "intake_started": False,
+    "deliberation_started": False,
+    "deliberation_result": None,
+    "patient_summary": None,
+    # Hash of the supervisor decision "patient_summary" was written from
+    "patient_summary_key": None,
+    "patient_pdf": None,
+    "pdf_job": None,
+    # (start time, Future) of the MedBLIP image analysis running on the inference executor
+    "image_job": None,
+    # (file name, sha256) -> decoded upload, only for the files currently uploaded
+    "upload_cache": dict,
+    "session_id": lambda: str(uuid.uuid4()),
+}
+
+
+def _session_defaults() -> Dict[str, Any]:
+    """Fresh default values for the per-session state"""
+    return {
+        key: value() if callable(value) else value
+        for key, value in _SESSION_DEFAULTS.items()
+    }
+
+
 def initialize_session_state():
-    """Initialize session state for Multi-Agent system"""
-    if "admin_agent" not in st.session_state:
-        st.session_state.admin_agent = None
-    if "supervisor_agent" not in st.session_state:
-        st.session_state.supervisor_agent = None
-    if "doctor_agents" not in st.session_state:
-        st.session_state.doctor_agents = None
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
-    if "current_stage" not in st.session_state:
-        st.session_state.current_stage = "greeting"
-    if "conversation_complete" not in st.session_state:
-        st.session_state.conversation_complete = False
-    if "handoff_data" not in st.session_state:
-        st.session_state.handoff_data = {}
-    if "intake_started" not in st.session_state:
-        st.session_state.intake_started = False
-    if "deliberation_started" not in st.session_state:
-        st.session_state.deliberation_started = False
-    if "deliberation_result" not in st.session_state:
-        st.session_state.deliberation_result = None
-    if "session_id" not in st.session_state:
-        import uuid
-        st.session_state.session_id = str(uuid.uuid4())
+    """Initialize session state for Multi-Agent system (only missing keys are built)"""
+    for key, value in _SESSION_DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = value() if callable(value) else value
+
+
+def reset_session_state(clear_models: bool = False):
+    """Reset the session in place (button callback, runs before the rerun)
+
+    The Admin Agent is kept and only its intake state is cleared, so a new
+    consultation reuses its compiled workflow and MedBLIP tool handle. The
+    supervisor/doctors and LLM clients are process-wide caches and survive anyway.
+
+    clear_models=True additionally drops the cached MedBLIP tool and doctor panel
+    (scoped .clear() calls; never st.cache_resource.clear(), which would also drop
+    unrelated resources such as the executors and font registration).
+    """
+    admin_agent = st.session_state.get("admin_agent")
+    st.session_state.update(_session_defaults())
+    if clear_models:
+        from app.tools.medblip_tool import reset_shared_medblip_tool
+        reset_shared_medblip_tool()
+        preload_medblip_tool.clear()
+        preload_supervisor_and_doctors.clear()
+        # The old agent holds the previous MedBLIP tool; build a fresh one
+        return
+    if admin_agent is not None:
+        admin_agent.reset()
+        st.session_state.admin_agent = admin_agent
+
+
+# Multi-agent workflow stages
+STAGES = {
+    "greeting": "🤝 서비스 소개",
+    "demographics": "📝 인구학적 정보 수집",
+    "history": "📋 과거 병력 문진",
+    "symptoms": "🩺 현재 증상 문진",
+    "medications": "💊 복용 약물 확인",
+    "image_request": "📷 이미지 업로드 요청",
+    "image_analysis": "🔍 MedBLIP 이미지 분석",
+    "deliberation": "🎯 Multi-Agent 심의",
+    "completed": "✅ 분석 완료"
+}
+
+# Sidebar progress markdown per current stage, built once (None: no stage highlighted)
+_STAGE_PROGRESS_MARKDOWN = {
+    current: "\n\n".join(
+        f"**➤ {description}**" if stage == current else description
+        for stage, description in STAGES.items()
+    )
+    for current in [*STAGES, None]
+}
 
 
 def render_sidebar():
@@ -95,41 +243,120 @@ def render_sidebar():
         st.markdown("---")
         st.markdown("### 진행 단계")
 
-        # Multi-agent workflow stages
-        stages = {
-            "greeting": "🤝 서비스 소개",
-            "demographics": "📝 인구학적 정보 수집",
-            "history": "📋 과거 병력 문진",
-            "symptoms": "🩺 현재 증상 문진",
-            "medications": "💊 복용 약물 확인",
-            "image_request": "📷 이미지 업로드 요청",
-            "image_analysis": "🔍 MedBLIP 이미지 분석",
-            "deliberation": "🎯 Multi-Agent 심의",
-            "completed": "✅ 분석 완료"
-        }
-
-        current_stage = st.session_state.current_stage
-        for stage, description in stages.items():
-            if stage == current_stage:
-                st.markdown(f"**➤ {description}**")
-            else:
-                st.markdown(f"   {description}")
+        # One markdown element for the whole progress list
+        st.markdown(_STAGE_PROGRESS_MARKDOWN.get(
+            st.session_state.current_stage, _STAGE_PROGRESS_MARKDOWN[None]
+        ))
 
         st.markdown("---")
         st.markdown("### 서비스 안내")
         st.info("LangGraph 기반 Multi-Agent 시스템으로 체계적인 의료 상담을 제공합니다.")
 
-        if st.button("새로 시작"):
-            keys_to_clear = [
-                "admin_agent", "supervisor_agent", "doctor_agents",
-                "messages", "current_stage", "conversation_complete",
-                "handoff_data", "intake_started", "deliberation_started",
-                "deliberation_result", "session_id"
-            ]
-            for key in keys_to_clear:
-                if key in st.session_state:
-                    del st.session_state[key]
-            st.rerun()
+        st.button("새로 시작", on_click=reset_session_state)
+        st.button(
+            "모델 재로딩",
+            type="secondary",
+            on_click=reset_session_state,
+            kwargs={"clear_models": True},
+            help="MedBLIP 모델과 의료진 패널을 다시 불러오고 새로 시작합니다.",
+        )
+
+
+def _decode_dicom(ds) -> Image.Image:
+    """Render a DICOM dataset the way a viewer would (modality LUT, VOI window, MONOCHROME1)"""
+    frames = int(getattr(ds, "NumberOfFrames", 1) or 1)
+    if frames > 1 and dicom_pixel_array is not None:
+        # Multi-frame series: decode and window only the middle frame, not the whole volume
+        pixels = dicom_pixel_array(ds, index=frames // 2)
+    else:
+        pixels = ds.pixel_array
+        if frames > 1:
+            # pydicom < 3 cannot decode a single frame; slice after the full decode
+            pixels = pixels[frames // 2]
+    # RescaleSlope/Intercept, then WindowCenter/Width (or VOI LUT sequence)
+    arr = apply_voi_lut(apply_modality_lut(pixels, ds), ds).astype(np.float32, copy=False)
+    lo, hi = float(arr.min()), float(arr.max())
+    # Vectorized normalization to 8-bit (in place, no extra full-size temporaries)
+    arr -= lo
+    arr *= 255 / max(hi - lo, 1e-6)
+    np.clip(arr, 0, 255, out=arr)
+    if getattr(ds, "PhotometricInterpretation", "") == "MONOCHROME1":
+        # MONOCHROME1 stores inverted grayscale
+        np.subtract(255, arr, out=arr)
+    return Image.fromarray(arr.astype(np.uint8)).convert("RGB")
+
+
+# Upload types accepted by the image uploader, and the PIL decoder for each raster type
+ALLOWED_IMAGE_EXTENSIONS = ("png", "jpg", "jpeg", "dcm")
+_PIL_FORMATS = {"png": ("PNG",), "jpg": ("JPEG",), "jpeg": ("JPEG",)}
+
+
+# Decoded uploads are kept at most this large; enough for the on-page preview, and
+# analysis only needs MEDBLIP_INPUT_SIZE
+UPLOAD_MAX_SIZE = 1024
+
+
+def _decode_upload(name: str, data: bytes) -> Image.Image:
+    """Decode uploaded image bytes into a downscaled, fully loaded PIL Image"""
+    buffer = io.BytesIO(data)
+    ext = name.rsplit(".", 1)[-1].lower()
+    if ext == "dcm":
+        if pydicom is None:
+            raise ValueError("DICOM 파일을 읽으려면 pydicom 패키지가 필요합니다.")
+        # Large non-pixel elements are only read if accessed
+        image = _decode_dicom(pydicom.dcmread(buffer, defer_size="4 MB"))
+    else:
+        try:
+            # The extension tells us the format, so only that decoder is probed
+            image = Image.open(buffer, formats=_PIL_FORMATS.get(ext))
+        except UnidentifiedImageError:
+            # Misnamed file: fall back to full format detection
+            buffer.seek(0)
+            image = Image.open(buffer)
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+    # thumbnail() also lets the JPEG decoder decode at reduced scale (draft mode)
+    image.thumbnail((UPLOAD_MAX_SIZE, UPLOAD_MAX_SIZE), Image.LANCZOS)
+    # thumbnail() skips the decode for images already within the bound; load here so
+    # the cached image is not a lazy BytesIO-backed file decoded by several threads
+    image.load()
+    return image
+
+
+def _open_uploaded_images(uploaded_files) -> List[Image.Image]:
+    """Open uploaded files as PIL Images, decoding DICOM via pydicom
+
+    Decoded images are kept per session (keyed by name and content hash) so reruns
+    skip the decode; only the current uploads are kept, and reset_session_state
+    drops them. Callers only read the images (st.image, MedBLIP preprocessing).
+    """
+    cache = st.session_state.upload_cache
+    current = {}
+    images = []
+    for uploaded_file in uploaded_files:
+        data = uploaded_file.getvalue()
+        key = (uploaded_file.name, hashlib.sha256(data).hexdigest())
+        image = current.get(key) or cache.get(key)
+        if image is None:
+            image = _decode_upload(uploaded_file.name, data)
+        current[key] = image
+        images.append(image)
+    st.session_state.upload_cache = current
+    return images
+
+
+# MedBLIP(BLIP) 프로세서의 입력 해상도
+MEDBLIP_INPUT_SIZE = 384
+
+
+def _prepare_image(pil: Image.Image, target: int = MEDBLIP_INPUT_SIZE) -> Image.Image:
+    """Downscale an image to MedBLIP's input resolution before handing it to the agents
+
+    convert()가 복사본을 만들므로 캐시된 원본(화면 표시용)은 그대로 유지됩니다.
+    """
+    img = pil.convert("RGB")
+    img.thumbnail((target, target), Image.LANCZOS)
+    return img
 
 
 def handle_image_upload():
@@ -138,34 +365,96 @@ def handle_image_upload():
         st.markdown("---")
         st.subheader("📷 방사선 이미지 업로드")
 
-        uploaded_file = st.file_uploader(
+        # 분석 중에는 업로드 대신 진행 상태만 표시
+        if st.session_state.image_job is not None:
+            render_image_job()
+            return
+
+        # MedBLIP 모델은 이 단계에 처음 도달했을 때 한 번만 로드 (프로세스 공유)
+        if st.session_state.admin_agent:
+            with st.spinner("MedBLIP 모델 준비 중..."):
+                st.session_state.admin_agent.prepare_image_analysis()
+
+        uploaded_files = st.file_uploader(
             "방사선 이미지 선택",
-            type=['png', 'jpg', 'jpeg', 'dcm'],
-            help="PNG, JPG, JPEG, DICOM 형식을 지원합니다.",
+            type=list(ALLOWED_IMAGE_EXTENSIONS),
+            help="PNG, JPG, JPEG, DICOM 형식을 지원합니다. 여러 장을 함께 올리면 한 번에 분석합니다.",
+            accept_multiple_files=True,
             key="image_uploader"
         )
 
-        if uploaded_file is not None:
-            # Convert uploaded file to PIL Image
-            image = Image.open(uploaded_file)
+        if uploaded_files:
+            # Convert uploaded files to PIL Images (analyzed as a single batch)
+            try:
+                images = _open_uploaded_images(uploaded_files)
+            except Exception as e:
+                st.error(f"이미지를 읽을 수 없습니다: {str(e)}")
+                return
 
             col1, col2 = st.columns([1, 1])
 
             with col1:
                 st.image(
-                    uploaded_file,
-                    caption="업로드된 방사선 이미지",
+                    images,
+                    caption=["업로드된 방사선 이미지"] * len(uploaded_files),
                     use_column_width=True
                 )
 
             with col2:
-                st.success("이미지 업로드 완료!")
+                st.success(f"이미지 {len(images)}장 업로드 완료!")
                 if st.button("이미지 분석 시작", type="primary"):
                     # 상태를 이미지 분석으로 먼저 업데이트
                     st.session_state.current_stage = "image_analysis"
-                    # Admin Agent에서 이미지 처리 (중복 spinner 제거)
-                    with st.spinner("MedBLIP이 이미지 분석중.."):
-                        process_with_admin_agent("이미지를 업로드했습니다.", image, show_spinner=False)
+                    # 추론은 백그라운드 스레드에서 실행하여 UI가 멈추지 않도록 함
+                    # 화면에는 원본을 표시하고, 에이전트에는 축소본만 전달
+                    process_image_in_background(
+                        "이미지를 업로드했습니다.",
+                        [_prepare_image(image) for image in images]
+                    )
+
+
+def process_image_in_background(user_input: str, images):
+    """Start Admin Agent image processing on the inference executor
+
+    The Future is kept in the session so the result is applied even if this run
+    is interrupted; render_image_job() polls it and applies it once.
+    """
+    if not st.session_state.admin_agent:
+        st.error("Admin Agent가 초기화되지 않았습니다.")
+        return
+
+    st.session_state.messages.append({"role": "user", "content": user_input})
+    future = get_inference_executor().submit(
+        st.session_state.admin_agent.process_user_input, user_input, images
+    )
+    st.session_state.image_job = (time.monotonic(), future)
+    st.rerun()
+
+
+@st.fragment(run_every=1.0)
+def _poll_image_job():
+    """Poll the background image analysis; a full rerun applies the result"""
+    job = st.session_state.image_job
+    if job is None or job[1].done():
+        st.rerun()
+    st.info(f"MedBLIP이 이미지 분석중.. ({time.monotonic() - job[0]:.0f}초)")
+
+
+def render_image_job():
+    """Show the image analysis progress, or apply its result once it has finished"""
+    job = st.session_state.image_job
+    if not job[1].done():
+        _poll_image_job()
+        return
+
+    # Cleared before applying, so whichever run sees it done applies it exactly once
+    st.session_state.image_job = None
+    try:
+        result = job[1].result()
+    except Exception as e:
+        st.error(f"Admin Agent 처리 중 예외 발생: {str(e)}")
+        return
+    _apply_admin_result(result)
 
 
 def process_with_admin_agent(user_input: str, image=None, show_spinner=True):
@@ -189,28 +478,50 @@ def _execute_admin_processing(user_input: str, image=None):
         result = st.session_state.admin_agent.process_user_input(
             user_input, image
         )
+    except Exception as e:
+        st.error(f"Admin Agent 처리 중 예외 발생: {str(e)}")
+        return
+    # Called from the chat fragment, so same-stage replies only rerun the chat
+    _apply_admin_result(result, in_fragment=True)
 
+
+def _apply_admin_result(result: Dict[str, Any], in_fragment: bool = False):
+    """Apply an Admin Agent result to the session state and rerun
+
+    Replies that keep the current stage only need the chat area redrawn; a stage
+    change also updates the sidebar progress and the image upload section, so
+    those (and anything outside the chat fragment) rerun the whole app.
+    """
+    try:
         if result["success"]:
-            # Update session state
-            st.session_state.current_stage = result["current_stage"]
-            st.session_state.conversation_complete = result[
-                "conversation_complete"
-            ]
+            previous_stage = st.session_state.current_stage
 
-            # Add new messages
+            # Add new messages: the agent returns its full log, so only the part
+            # after the cursor (what has not been mirrored yet) is copied. User
+            # turns are stored locally when sent (so they survive a failed turn),
+            # so their echo in the agent log is skipped.
             new_messages = result["messages"]
-            if new_messages:
-                # Only add new messages (avoid duplicates)
-                existing_count = len(st.session_state.messages)
-                if len(new_messages) > existing_count:
-                    for msg in new_messages[existing_count:]:
-                        st.session_state.messages.append(msg)
+            st.session_state.messages.extend(
+                message for message in new_messages[st.session_state.msg_cursor:]
+                if message["role"] != "user"
+            )
 
+            # Update session state in one write
+            updates = {
+                "current_stage": result["current_stage"],
+                "conversation_complete": result["conversation_complete"],
+                "msg_cursor": len(new_messages),
+            }
             # Store case context if conversation is complete
             if (result["conversation_complete"] and
                     result.get("case_context")):
-                st.session_state.handoff_data = result["case_context"]
+                updates["handoff_data"] = result["case_context"]
+            st.session_state.update(updates)
 
+            if (in_fragment and
+                    result["current_stage"] == previous_stage and
+                    not result["conversation_complete"]):
+                st.rerun(scope="fragment")
             st.rerun()
         else:
             st.error(f"처리 중 오류 발생: {result['error']}")
@@ -219,22 +530,43 @@ def _execute_admin_processing(user_input: str, image=None):
         st.error(f"Admin Agent 처리 중 예외 발생: {str(e)}")
 
 
+# Number of most recent chat messages rendered on every run
+MAX_VISIBLE_MESSAGES = 20
+
+
+@st.fragment
 def render_chat_interface():
-    """Render chat interface for Admin Agent"""
-    # Display chat messages
-    for message in st.session_state.messages:
+    """Render chat interface for Admin Agent
+
+    fragment로 감싸 채팅 입력이 전체 스크립트가 아닌 이 영역만 다시 실행하도록 합니다.
+    같은 단계의 응답은 이 영역만, 단계가 바뀌는 응답은 _apply_admin_result에서 전체 화면을 갱신합니다.
+    """
+    messages = st.session_state.messages
+    hidden_count = max(0, len(messages) - MAX_VISIBLE_MESSAGES)
+
+    # Older messages are only rendered on request
+    if hidden_count and st.toggle(f"이전 대화 보기 ({hidden_count}개)", key="show_older_messages"):
+        for message in messages[:hidden_count]:
+            with st.chat_message(message["role"]):
+                st.markdown(message["content"])
+
+    # Display recent chat messages
+    for message in messages[hidden_count:]:
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
 
     # Chat input (only if conversation not complete)
     if not st.session_state.conversation_complete:
         if prompt := st.chat_input("메시지를 입력하세요..."):
-            # Add user message to display
+            # Store and show the prompt right away; the agent's echo of it is
+            # skipped when its log is mirrored
             st.session_state.messages.append({"role": "user", "content": prompt})
-
             with st.chat_message("user"):
                 st.markdown(prompt)
 
+            # Intake has begun: load MedBLIP in the background for the image step
+            preload_medblip_tool()
+
             # Process with Admin Agent
             process_with_admin_agent(prompt)
     else:
@@ -266,12 +598,25 @@ def start_multi_agent_deliberation():
             # Update progress to deliberation stage
             st.session_state.current_stage = "deliberation"
 
-            with st.spinner("Multi-Agent 심의 진행 중..."):
-                result = st.session_state.supervisor_agent.start_deliberation(
+            # 라운드가 끝날 때마다 진행 상황을 표시 (전체 결과는 마지막에 한 번)
+            result = {}
+            with st.status("Multi-Agent 심의 진행 중...", expanded=True) as status:
+                for update in st.session_state.supervisor_agent.start_deliberation_stream(
                     session_id=st.session_state.session_id,
                     case_context=st.session_state.handoff_data,
                     doctors=st.session_state.doctor_agents
-                )
+                ):
+                    if "result" in update:
+                        result = update["result"]
+                        status.update(label="Multi-Agent 심의 완료", state="complete", expanded=False)
+                        continue
+
+                    hypotheses = update["decision"].get("consensus_hypotheses") or []
+                    st.write(
+                        f"라운드 {update['round']}/{update['max_rounds']} 완료"
+                        + (f" — 주요 가설: {hypotheses[0]}" if hypotheses else "")
+                    )
+                    status.update(label=f"Multi-Agent 심의 진행 중... (라운드 {update['round']}/{update['max_rounds']})")
 
                 st.session_state.deliberation_started = True
                 st.session_state.deliberation_result = result
@@ -330,28 +675,65 @@ def display_deliberation_results(result):
         if "patient_summary" in st.session_state and st.session_state.patient_summary:
             if st.button("📄 PDF 생성", type="secondary", key="generate_pdf_btn"):
                 generate_patient_pdf()
+            render_patient_pdf()
 
     else:
         st.error(f"Multi-Agent 심의 실패: {result.get('error', 'Unknown error')}")
 
 
+def throttled(tokens, min_interval=0.05, min_chars=8):
+    """Batch streamed tokens so the UI updates at most ~20 times per second"""
+    buffer = ""
+    last_flush = time.monotonic()
+    for token in tokens:
+        buffer += token
+        now = time.monotonic()
+        if len(buffer) >= min_chars and now - last_flush >= min_interval:
+            yield buffer
+            buffer = ""
+            last_flush = now
+    if buffer:
+        yield buffer
+
+
 def generate_patient_summary(supervisor_decision):
     """Generate patient-friendly summary using admin agent"""
     if st.session_state.admin_agent:
         try:
-            with st.spinner("환자 친화적 요약 생성 중..."):
-                patient_summary = st.session_state.admin_agent.create_patient_summary(
-                    supervisor_decision
-                )
+            st.markdown("---")
+            st.subheader("📝 환자용 요약")
+
+            st.markdown("### 상담 결과")
+            streamed = False
 
-                # Store patient summary in session state for PDF generation
-                st.session_state.patient_summary = patient_summary
+            def write_stream(tokens):
+                nonlocal streamed
+                text = st.write_stream(throttled(tokens))
+                streamed = True
+                return text
 
-                st.markdown("---")
-                st.subheader("📝 환자용 요약")
+            # 같은 합의 결과로 다시 요청하면 LLM을 재호출하지 않고 이전 요약을 재사용
+            # (세션 안에서만 보관: 다른 세션과 환자 데이터를 공유하지 않음)
+            summary_key = hashlib.sha256(
+                repr(supervisor_decision).encode("utf-8")
+            ).hexdigest()
 
-                st.markdown("### 상담 결과")
-                st.markdown(patient_summary["summary_text"])
+            with st.spinner("환자 친화적 요약 생성 중..."):
+                if (st.session_state.patient_summary
+                        and st.session_state.patient_summary_key == summary_key):
+                    patient_summary = st.session_state.patient_summary
+                else:
+                    patient_summary = st.session_state.admin_agent.create_patient_summary(
+                        supervisor_decision, stream_writer=write_stream
+                    )
+
+                    # Store patient summary in session state for PDF generation
+                    st.session_state.patient_summary = patient_summary
+                    st.session_state.patient_summary_key = summary_key
+
+                # Offline template summaries are not streamed
+                if not streamed:
+                    st.markdown(patient_summary["summary_text"])
 
                 st.markdown("### ⚠️ 중요 안내사항")
                 for disclaimer in patient_summary["disclaimers"]:
@@ -363,9 +745,9 @@ def generate_patient_summary(supervisor_decision):
         st.error("Admin Agent가 초기화되지 않았습니다.")
 
 
-def generate_basic_info_summary(handoff_data: Dict[str, Any]) -> str:
+def generate_basic_info_summary(handoff_data: Dict[str, Any], llm) -> str:
     """Generate LLM summary for patient basic information"""
-    if not st.session_state.admin_agent or not st.session_state.admin_agent.llm:
+    if llm is None:
         return ""
 
     try:
@@ -390,7 +772,7 @@ def generate_basic_info_summary(handoff_data: Dict[str, Any]) -> str:
 요약은 짧고 간결하게 작성해주세요."""
 
         from langchain_core.messages import HumanMessage
-        response = st.session_state.admin_agent.llm.invoke([HumanMessage(content=prompt)])
+        response = llm.invoke([HumanMessage(content=prompt)])
         return response.content.strip()
 
     except Exception as e:
@@ -398,9 +780,9 @@ def generate_basic_info_summary(handoff_data: Dict[str, Any]) -> str:
         return ""
 
 
-def generate_consultation_summary(patient_summary: Dict[str, Any]) -> str:
+def generate_consultation_summary(patient_summary: Dict[str, Any], llm) -> str:
     """Generate LLM summary for consultation results"""
-    if not st.session_state.admin_agent or not st.session_state.admin_agent.llm:
+    if llm is None:
         return ""
 
     try:
@@ -419,7 +801,7 @@ def generate_consultation_summary(patient_summary: Dict[str, Any]) -> str:
 요약은 매우 짧고 간결하게 작성하되, 정확성을 유지해주세요."""
 
         from langchain_core.messages import HumanMessage
-        response = st.session_state.admin_agent.llm.invoke([HumanMessage(content=prompt)])
+        response = llm.invoke([HumanMessage(content=prompt)])
         return response.content.strip()
 
     except Exception as e:
@@ -427,261 +809,439 @@ def generate_consultation_summary(patient_summary: Dict[str, Any]) -> str:
         return ""
 
 
-def generate_patient_pdf():
-    """Generate PDF with patient basic info and patient-friendly summary"""
-    try:
-        # Create a PDF buffer
-        buffer = io.BytesIO()
-
-        # Create PDF document
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=18
-        )
+# Bundled font locations: project root first, then the working directory
+_KOREAN_FONT_FILE = 'NotoSansKR-Regular.ttf'
+_KOREAN_FONT_CANDIDATES = (
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), _KOREAN_FONT_FILE),
+    os.path.join(os.getcwd(), _KOREAN_FONT_FILE),
+)
 
-        # Container for PDF elements
-        elements = []
 
-        # Register Korean font (Noto Sans KR)
-        try:
-            # Get the absolute path to the font file in the project root
-            # Use multiple methods to find the project root
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.dirname(current_dir)
-            font_path = os.path.join(project_root, 'NotoSansKR-Regular.ttf')
-
-            # If not found, try current working directory
-            if not os.path.exists(font_path):
-                font_path = os.path.join(os.getcwd(), 'NotoSansKR-Regular.ttf')
-
-            if os.path.exists(font_path):
-                pdfmetrics.registerFont(TTFont('NotoSansKR', font_path))
-                korean_font = 'NotoSansKR'
-            else:
-                raise FileNotFoundError(f"Font file not found at: {font_path}")
-        except Exception as e:
-            # If font file not found, use default
-            korean_font = 'Helvetica'
-            st.warning(f"한글 폰트를 찾을 수 없어 기본 폰트를 사용합니다. 경로: {font_path if 'font_path' in locals() else 'unknown'}. Error: {str(e)}")
-
-        # Define styles
-        styles = getSampleStyleSheet()
-
-        # Title style
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontName=korean_font,
-            fontSize=24,
-            textColor='#1f4788',
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
+@st.cache_resource(show_spinner=False)
+def register_korean_font():
+    """Register the bundled Noto Sans KR font once per process (cached).
 
-        # Heading style
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontName=korean_font,
-            fontSize=16,
-            textColor='#2c5aa0',
-            spaceAfter=12,
-            spaceBefore=12
+    Returns (font_name, warning_message); falls back to Helvetica if the font is missing.
+    """
+    font_path = next((path for path in _KOREAN_FONT_CANDIDATES if os.path.exists(path)), None)
+    if font_path is None:
+        return 'Helvetica', (
+            "한글 폰트를 찾을 수 없어 기본 폰트를 사용합니다. "
+            f"경로: {', '.join(_KOREAN_FONT_CANDIDATES)}"
         )
 
-        # Body style
-        body_style = ParagraphStyle(
-            'CustomBody',
-            parent=styles['BodyText'],
-            fontName=korean_font,
-            fontSize=11,
-            leading=16,
-            spaceAfter=12
-        )
+    try:
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
 
-        # Summary style (for LLM-generated summaries)
-        summary_style = ParagraphStyle(
-            'Summary',
-            parent=styles['BodyText'],
-            fontName=korean_font,
-            fontSize=11,
-            leading=16,
-            textColor='#2c3e50',
-            leftIndent=10,
-            rightIndent=10,
-            spaceAfter=12,
-            spaceBefore=8
+        pdfmetrics.registerFont(TTFont('NotoSansKR', font_path))
+        return 'NotoSansKR', None
+    except Exception as e:
+        # Unreadable font file, use default
+        return 'Helvetica', (
+            f"한글 폰트를 불러올 수 없어 기본 폰트를 사용합니다. "
+            f"경로: {font_path}. Error: {str(e)}"
         )
 
-        # Warning style
-        warning_style = ParagraphStyle(
-            'Warning',
-            parent=styles['BodyText'],
-            fontName=korean_font,
-            fontSize=10,
-            textColor='#856404',
-            leftIndent=20,
-            spaceAfter=8
-        )
 
-        # Add title
-        elements.append(Paragraph("의료 상담 결과 보고서", title_style))
-        elements.append(Spacer(1, 0.2*inch))
+@lru_cache(maxsize=4)
+def _pdf_styles(korean_font: str) -> Dict[str, "ParagraphStyle"]:
+    """Paragraph styles for the patient PDF, built once per font (shared across builds)"""
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    # Define styles
+    styles = getSampleStyleSheet()
+
+    # Title style
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontName=korean_font,
+        fontSize=24,
+        textColor='#1f4788',
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+
+    # Heading style
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontName=korean_font,
+        fontSize=16,
+        textColor='#2c5aa0',
+        spaceAfter=12,
+        spaceBefore=12
+    )
 
-        # Add generation date
-        date_str = datetime.now().strftime("%Y년 %m월 %d일 %H:%M")
-        elements.append(Paragraph(f"생성일시: {date_str}", body_style))
-        elements.append(Spacer(1, 0.3*inch))
+    # Body style (CJK line breaking: Korean text may run long without spaces)
+    body_style = ParagraphStyle(
+        'CustomBody',
+        parent=styles['BodyText'],
+        fontName=korean_font,
+        fontSize=11,
+        leading=16,
+        spaceAfter=12,
+        wordWrap='CJK'
+    )
+
+    # Summary style (for LLM-generated summaries)
+    summary_style = ParagraphStyle(
+        'Summary',
+        parent=styles['BodyText'],
+        fontName=korean_font,
+        fontSize=11,
+        leading=16,
+        textColor='#2c3e50',
+        leftIndent=10,
+        rightIndent=10,
+        spaceAfter=12,
+        spaceBefore=8,
+        wordWrap='CJK'
+    )
+
+    # Warning style
+    warning_style = ParagraphStyle(
+        'Warning',
+        parent=styles['BodyText'],
+        fontName=korean_font,
+        fontSize=10,
+        textColor='#856404',
+        leftIndent=20,
+        spaceAfter=8,
+        wordWrap='CJK'
+    )
 
-        # Add patient basic information
-        elements.append(Paragraph("환자 기본 정보", heading_style))
-
-        if st.session_state.handoff_data:
-            demographics = st.session_state.handoff_data.get("demographics", {})
-            if demographics and demographics.get("raw_input"):
-                elements.append(Paragraph(f"인구학적 정보: {demographics.get('raw_input', 'N/A')}", body_style))
-
-            history = st.session_state.handoff_data.get("history", {})
-            if history and history.get("raw_input"):
-                elements.append(Paragraph(f"과거 병력: {history.get('raw_input', 'N/A')}", body_style))
-
-            symptoms = st.session_state.handoff_data.get("symptoms", {})
-            if symptoms and symptoms.get("raw_input"):
-                elements.append(Paragraph(f"현재 증상: {symptoms.get('raw_input', 'N/A')}", body_style))
-
-            meds = st.session_state.handoff_data.get("meds", {})
-            if meds and meds.get("raw_input"):
-                elements.append(Paragraph(f"복용 약물: {meds.get('raw_input', 'N/A')}", body_style))
-
-            # Generate LLM summary for patient basic information
-            if st.session_state.admin_agent and st.session_state.admin_agent.llm:
-                try:
-                    with st.spinner("기본 정보 요약 생성 중..."):
-                        basic_info_summary = generate_basic_info_summary(st.session_state.handoff_data)
-                        if basic_info_summary:
-                            elements.append(Spacer(1, 0.2*inch))
-                            elements.append(Paragraph("환자 기본 정보 요약", heading_style))
-                            for para in basic_info_summary.split('\n'):
-                                if para.strip():
-                                    elements.append(Paragraph(para.strip(), summary_style))
-                except Exception as e:
-                    logger.error(f"기본 정보 요약 생성 실패: {str(e)}")
+    # Footer style
+    footer_style = ParagraphStyle(
+        'Footer',
+        parent=styles['Normal'],
+        fontName=korean_font,
+        fontSize=9,
+        textColor='#666666',
+        alignment=TA_CENTER
+    )
+
+    return {
+        "title": title_style,
+        "heading": heading_style,
+        "body": body_style,
+        "summary": summary_style,
+        "warning": warning_style,
+        "footer": footer_style,
+    }
+
+
+# Markdown markers stripped from the summary text before it goes into the PDF
+_MARKDOWN_RE = re.compile(r"\*\*|###|##")
+
+# (handoff_data key, PDF label) for the patient basic information block
+_PDF_BASIC_INFO_FIELDS = (
+    ("demographics", "인구학적 정보"),
+    ("history", "과거 병력"),
+    ("symptoms", "현재 증상"),
+    ("meds", "복용 약물"),
+)
+
+
+def _text_paragraph(text: str, style) -> "Paragraph":
+    """Build one Paragraph for multi-line text (blank lines dropped, markup escaped)"""
+    from reportlab.platypus import Paragraph
+
+    lines = [escape(line.strip()) for line in text.split('\n') if line.strip()]
+    return Paragraph("<br/><br/>".join(lines), style)
+
+
+def _build_patient_pdf(handoff_data: Dict[str, Any],
+                       patient_summary: Dict[str, Any],
+                       session_id: str,
+                       korean_font: str,
+                       llm=None) -> bytes:
+    """Build the patient PDF and return its bytes
+
+    Pure function (no st.* calls) so it can run on the PDF executor thread.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
+    # Create a PDF buffer
+    buffer = io.BytesIO()
+
+    # Create PDF document
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=18,
+        # Flate-compress page content streams (smaller download)
+        compress=1
+    )
+
+    # Container for PDF elements
+    elements = []
+
+    styles = _pdf_styles(korean_font)
+    title_style = styles["title"]
+    heading_style = styles["heading"]
+    body_style = styles["body"]
+    summary_style = styles["summary"]
+    warning_style = styles["warning"]
+    footer_style = styles["footer"]
+
+    # Add title
+    elements.append(Paragraph("의료 상담 결과 보고서", title_style))
+    elements.append(Spacer(1, 0.2*inch))
+
+    # Add generation date
+    date_str = datetime.now().strftime("%Y년 %m월 %d일 %H:%M")
+    elements.append(Paragraph(f"생성일시: {date_str}", body_style))
+    elements.append(Spacer(1, 0.3*inch))
+
+    # Add patient basic information
+    elements.append(Paragraph("환자 기본 정보", heading_style))
+
+    if handoff_data:
+        # All labeled fields go into one flowable
+        basic_info = []
+        for key, label in _PDF_BASIC_INFO_FIELDS:
+            section = handoff_data.get(key, {})
+            if section and section.get("raw_input"):
+                basic_info.append(f"{label}: {escape(' '.join(section['raw_input'].split()))}")
+        if basic_info:
+            elements.append(Paragraph("<br/>".join(basic_info), body_style))
+
+        # Generate LLM summary for patient basic information
+        if llm is not None:
+            try:
+                basic_info_summary = generate_basic_info_summary(handoff_data, llm)
+                if basic_info_summary:
+                    elements.append(Spacer(1, 0.2*inch))
+                    elements.append(Paragraph("환자 기본 정보 요약", heading_style))
+                    elements.append(_text_paragraph(basic_info_summary, summary_style))
+            except Exception as e:
+                logger.error(f"기본 정보 요약 생성 실패: {str(e)}")
+
+    elements.append(Spacer(1, 0.3*inch))
+
+    # Add patient summary
+    if patient_summary:
+        elements.append(Paragraph("토론 요약", heading_style))
+
+        # Clean and format summary text
+        summary_text = patient_summary.get("summary_text", "")
+        # Remove markdown formatting for PDF
+        summary_text = _MARKDOWN_RE.sub("", summary_text)
+
+        # Add all lines as a single flowable
+        elements.append(_text_paragraph(summary_text, body_style))
+
+        # Generate LLM summary for consultation results
+        if llm is not None:
+            try:
+                consultation_summary = generate_consultation_summary(patient_summary, llm)
+                if consultation_summary:
+                    elements.append(Spacer(1, 0.2*inch))
+                    elements.append(Paragraph("상담 결과 요약", heading_style))
+                    elements.append(_text_paragraph(consultation_summary, summary_style))
+            except Exception as e:
+                logger.error(f"토론 결과 요약 생성 실패: {str(e)}")
 
         elements.append(Spacer(1, 0.3*inch))
 
-        # Add patient summary
-        if st.session_state.patient_summary:
-            elements.append(Paragraph("토론 요약", heading_style))
-
-            # Clean and format summary text
-            summary_text = st.session_state.patient_summary.get("summary_text", "")
-            # Remove markdown formatting for PDF
-            summary_text = summary_text.replace("**", "").replace("###", "").replace("##", "")
-
-            # Split into paragraphs and add each
-            for para in summary_text.split('\n'):
-                if para.strip():
-                    elements.append(Paragraph(para.strip(), body_style))
-
-            # Generate LLM summary for consultation results
-            if st.session_state.admin_agent and st.session_state.admin_agent.llm:
-                try:
-                    with st.spinner("토론 결과 요약 생성 중..."):
-                        consultation_summary = generate_consultation_summary(st.session_state.patient_summary)
-                        if consultation_summary:
-                            elements.append(Spacer(1, 0.2*inch))
-                            elements.append(Paragraph("상담 결과 요약", heading_style))
-                            for para in consultation_summary.split('\n'):
-                                if para.strip():
-                                    elements.append(Paragraph(para.strip(), summary_style))
-                except Exception as e:
-                    logger.error(f"토론 결과 요약 생성 실패: {str(e)}")
-
-            elements.append(Spacer(1, 0.3*inch))
-
-            # Add disclaimers
-            elements.append(Paragraph("중요 안내사항", heading_style))
-            disclaimers = st.session_state.patient_summary.get("disclaimers", [])
-            for disclaimer in disclaimers:
-                elements.append(Paragraph(f"• {disclaimer}", warning_style))
-
-        elements.append(Spacer(1, 0.5*inch))
-
-        # Add footer
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontName=korean_font,
-            fontSize=9,
-            textColor='#666666',
-            alignment=TA_CENTER
-        )
-        elements.append(Paragraph("본 문서는 Multi-Agent 의료 상담 시스템에서 생성되었습니다.", footer_style))
-        elements.append(Paragraph("세션 ID: " + st.session_state.session_id, footer_style))
+        # Add disclaimers
+        elements.append(Paragraph("중요 안내사항", heading_style))
+        disclaimers = patient_summary.get("disclaimers", [])
+        for disclaimer in disclaimers:
+            elements.append(Paragraph(f"• {disclaimer}", warning_style))
+
+    elements.append(Spacer(1, 0.5*inch))
+
+    # Add footer
+    elements.append(Paragraph("본 문서는 Multi-Agent 의료 상담 시스템에서 생성되었습니다.", footer_style))
+    elements.append(Paragraph("세션 ID: " + session_id, footer_style))
+
+    # Build PDF
+    doc.build(elements)
+
+    # Get PDF data
+    pdf_data = buffer.getvalue()
+    buffer.close()
+    return pdf_data
+
+
+@st.cache_resource
+def get_pdf_executor():
+    """Executor for background PDF builds (cached)."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf")
+
+
+def _patient_pdf_key() -> str:
+    """Hash of the data the patient PDF is built from"""
+    return hashlib.sha256(repr((
+        st.session_state.handoff_data,
+        st.session_state.patient_summary,
+    )).encode("utf-8")).hexdigest()
+
+
+def generate_patient_pdf():
+    """Start building the patient PDF in the background
+
+    Does nothing if a PDF for the current data is already built or building;
+    render_patient_pdf() shows the progress and the download button.
+    """
+    pdf_key = _patient_pdf_key()
+    cached = st.session_state.patient_pdf
+    if cached and cached[0] == pdf_key:
+        return
+    job = st.session_state.pdf_job
+    if job and job[0] == pdf_key and not job[1].done():
+        return
+
+    # Register Korean font (Noto Sans KR, once per process)
+    korean_font, font_error = register_korean_font()
+    if font_error:
+        st.warning(font_error)
+
+    admin_agent = st.session_state.admin_agent
+    future = get_pdf_executor().submit(
+        _build_patient_pdf,
+        st.session_state.handoff_data,
+        st.session_state.patient_summary,
+        st.session_state.session_id,
+        korean_font,
+        admin_agent.llm if admin_agent else None,
+    )
+    st.session_state.pdf_job = (pdf_key, future)
 
-        # Build PDF
-        doc.build(elements)
 
-        # Get PDF data
-        pdf_data = buffer.getvalue()
-        buffer.close()
+@st.fragment(run_every=1.0)
+def _poll_patient_pdf():
+    """Poll the background PDF build; a full rerun swaps in the download button"""
+    job = st.session_state.pdf_job
+    if job is None or job[1].done():
+        st.rerun()
+    st.info("PDF 생성 중…")
 
+
+def render_patient_pdf():
+    """Show the PDF build status, or the download button once the PDF is ready"""
+    job = st.session_state.pdf_job
+    if job is not None and job[1].done():
+        st.session_state.pdf_job = None
+        try:
+            st.session_state.patient_pdf = (job[0], job[1].result())
+            st.success("PDF가 성공적으로 생성되었습니다!")
+        except Exception as e:
+            st.error(f"PDF 생성 중 오류 발생: {str(e)}")
+            logger.error(f"PDF generation error: {str(e)}")
+            return
+
+    cached = st.session_state.patient_pdf
+    if cached and cached[0] == _patient_pdf_key():
         # Offer download
         st.download_button(
             label="📥 PDF 다운로드",
-            data=pdf_data,
+            data=cached[1],
             file_name=f"medical_consultation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
             mime="application/pdf"
         )
+    elif st.session_state.pdf_job is not None:
+        _poll_patient_pdf()
 
-        st.success("PDF가 성공적으로 생성되었습니다!")
 
-    except Exception as e:
-        st.error(f"PDF 생성 중 오류 발생: {str(e)}")
-        logger.error(f"PDF generation error: {str(e)}")
+# (column, label, CaseContext key) for the handoff data panel
+_HANDOFF_JSON_FIELDS = (
+    (0, "인구학적 정보", "demographics"),
+    (0, "과거 병력", "history"),
+    (1, "현재 증상", "symptoms"),
+    (1, "복용 약물", "meds"),
+)
 
 
-def display_handoff_data():
-    """Display handoff data for next agent"""
-    if st.session_state.conversation_complete and st.session_state.handoff_data:
-        st.markdown("---")
-        st.subheader("📊 다음 에이전트로 전달되는 데이터")
+# Larger payloads are shown as truncated text instead of an st.json tree
+MAX_JSON_PANEL_CHARS = 8192
 
-        col1, col2 = st.columns(2)
 
-        with col1:
-            st.markdown("**인구학적 정보:**")
-            if st.session_state.handoff_data.get("demographics"):
-                st.json(st.session_state.handoff_data["demographics"])
+def _safe_json(value: Any):
+    """st.json for small values; a truncated st.code block for large ones"""
+    text = json.dumps(value, ensure_ascii=False, default=str)
+    if len(text) <= MAX_JSON_PANEL_CHARS:
+        st.json(value)
+    else:
+        st.code(text[:MAX_JSON_PANEL_CHARS] + " ... (truncated)", language="json")
 
-            st.markdown("**과거 병력:**")
-            if st.session_state.handoff_data.get("history"):
-                st.json(st.session_state.handoff_data["history"])
 
-        with col2:
-            st.markdown("**현재 증상:**")
-            if st.session_state.handoff_data.get("symptoms"):
-                st.json(st.session_state.handoff_data["symptoms"])
+def display_handoff_data():
+    """Display handoff data for next agent"""
+    handoff_data = st.session_state.handoff_data
+    if st.session_state.conversation_complete and handoff_data:
+        st.markdown("---")
+        st.subheader("📊 다음 에이전트로 전달되는 데이터")
 
-            st.markdown("**복용 약물:**")
-            if st.session_state.handoff_data.get("meds"):
-                st.json(st.session_state.handoff_data["meds"])
+        columns = st.columns(2)
+        for column, label, key in _HANDOFF_JSON_FIELDS:
+            with columns[column]:
+                st.markdown(f"**{label}:**")
+                value = handoff_data.get(key)
+                if value:
+                    _safe_json(value)
 
         st.markdown("**MedBLIP 분석 결과:**")
-        if st.session_state.handoff_data.get("medblip_findings"):
-            findings = st.session_state.handoff_data["medblip_findings"]
+        findings = handoff_data.get("medblip_findings")
+        if findings:
             if isinstance(findings, dict) and findings.get("description"):
                 st.text(findings["description"])
             else:
-                st.json(findings)
+                _safe_json(findings)
 
         st.markdown("**자유 텍스트:**")
-        if st.session_state.handoff_data.get("free_text"):
-            st.text(st.session_state.handoff_data["free_text"])
+        free_text = handoff_data.get("free_text")
+        if free_text:
+            st.text(free_text)
+
+
+@st.fragment
+def render_dev_panel():
+    """Development-only handoff data viewer.
+
+    fragment로 분리하여 체크박스를 토글해도 전체 앱이 다시 실행되지 않으며,
+    체크하지 않으면 st.json 직렬화 비용이 발생하지 않습니다.
+    """
+    if st.checkbox(
+        "다음 에이전트 전달 데이터 확인 (개발용)",
+        value=False
+    ):
+        display_handoff_data()
+
+
+def render_deliberation_section():
+    """Start deliberation once intake completes, then show its results"""
+    # Auto-start multi-agent deliberation when admin conversation completes
+    if (st.session_state.conversation_complete and
+            st.session_state.handoff_data and
+            not st.session_state.deliberation_started):
+        start_multi_agent_deliberation()
+
+    # Display deliberation results if available
+    if st.session_state.deliberation_result:
+        # Ensure status is set to completed when showing results
+        if (st.session_state.deliberation_result.get("success") and
+            st.session_state.current_stage != "completed"):
+            st.session_state.current_stage = "completed"
+        display_deliberation_results(st.session_state.deliberation_result)
+
+
+# Section rendered below the chat for each stage
+STAGE_SECTIONS = {
+    "image_request": handle_image_upload,
+    "image_analysis": handle_image_upload,
+    "deliberation": render_deliberation_section,
+    "completed": render_deliberation_section,
+}
 
 
 def main():
@@ -697,6 +1257,10 @@ def main():
     # Initialize session state
     initialize_session_state()
 
+    # Build the supervisor/doctor panel in the background while intake runs
+    # (MedBLIP starts loading once the user answers the first intake question)
+    preload_supervisor_and_doctors()
+
     # Load Admin Agent
     if not st.session_state.admin_agent:
         st.session_state.admin_agent = load_admin_agent()
@@ -708,6 +1272,7 @@ def main():
         if intake_result["success"]:
             st.session_state.intake_started = True
             st.session_state.messages.extend(intake_result["messages"])
+            st.session_state.msg_cursor = len(intake_result["messages"])
             st.session_state.current_stage = intake_result.get(
                 "current_stage", "demographics"
             )
@@ -729,30 +1294,13 @@ def main():
     # Render chat interface
     render_chat_interface()
 
-    # Image upload section
-    handle_image_upload()
-
-    # Auto-start multi-agent deliberation when admin conversation completes
-    if (st.session_state.conversation_complete and
-            st.session_state.handoff_data and
-            not st.session_state.deliberation_started):
-        start_multi_agent_deliberation()
-
-    # Display deliberation results if available
-    if st.session_state.deliberation_result:
-        # Ensure status is set to completed when showing results
-        if (st.session_state.deliberation_result.get("success") and
-            st.session_state.current_stage != "completed"):
-            st.session_state.current_stage = "completed"
-        display_deliberation_results(st.session_state.deliberation_result)
-
+    # Stage-specific section below the chat (intake stages have none)
+    section = STAGE_SECTIONS.get(st.session_state.current_stage)
+    if section is not None:
+        section()
 
     # Display handoff data if available (development option)
-    if st.checkbox(
-        "다음 에이전트 전달 데이터 확인 (개발용)",
-        value=False
-    ):
-        display_handoff_data()
+    render_dev_panel()
 
 
 if __name__ == "__main__":
@@ -4,18 +4,46 @@
 MedBLIP Tool - LangChain Tool로 구현된 MedBLIP 모델 인터페이스
 """
 
+import asyncio
 import os
 import logging
-from typing import Optional, Union, Dict, Any
+import random
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Optional, Union, Dict, Any, List, Set, Tuple
 from PIL import Image
 import torch
-from pydantic import Field
-from transformers import BlipForConditionalGeneration, BlipProcessor
+from pydantic import Field, PrivateAttr
 
 from langchain.tools import BaseTool
-from langchain_core.callbacks import CallbackManagerForToolRun
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
+
+from app.core.model_utils import (
+    env_positive_int,
+    load_medblip_model,
+    restore_eager_vision_model,
+    torch_compile_enabled,
+    warmup_medblip_model,
+)
 
-from app.core.model_utils import load_medblip_model
+try:
+    # Optional: decode image files straight to uint8 tensors (skips PIL -> numpy copies)
+    from torchvision.io import ImageReadMode, decode_image, read_file  # type: ignore
+except Exception:  # pragma: no cover - optional dependency path
+    decode_image = None  # type: ignore
+
+try:
+    # Optional: resize/normalize batches with torchvision (on the GPU when available)
+    # instead of the PIL/NumPy image processor
+    from torchvision.transforms import v2 as transforms_v2  # type: ignore
+except Exception:  # pragma: no cover - optional dependency path
+    transforms_v2 = None  # type: ignore
 
 # Docker 로그에서 확인 가능한 로거 설정
 logger = logging.getLogger(__name__)
@@ -25,6 +53,94 @@ logging.basicConfig(
 )
 
 
+# 여러 이미지 파일을 병렬로 디코딩할 때의 최대 스레드 수
+MAX_DECODE_WORKERS = 8
+
+# 기본 디코딩 빔 수: greedy(1)는 beam search보다 디코더 forward가 빔 수만큼 적음
+# (더 긴/정교한 캡션이 필요하면 MEDBLIP_NUM_BEAMS로 늘림)
+DEFAULT_NUM_BEAMS = env_positive_int("MEDBLIP_NUM_BEAMS", 1)
+
+# 캡션 디코딩 길이 (새로 생성하는 토큰 수 기준, 프롬프트 토큰 제외): 디코딩 step 수가 고정됨
+DEFAULT_MAX_NEW_TOKENS = 50
+DEFAULT_MIN_NEW_TOKENS = 10
+
+# 한 번의 generate에 넣는 최대 이미지 수 (GPU 메모리에 맞게 MEDBLIP_MAX_BATCH로 조정)
+MAX_BATCH_SIZE = env_positive_int("MEDBLIP_MAX_BATCH", 8)
+
+# 모델이 로드되지 않았을 때(데모 모드) 반환하는 분석 결과
+_DEMO_RESULTS = (
+    "Chest X-ray demonstrates clear lung fields with no acute "
+    "cardiopulmonary abnormalities. Heart size appears normal.",
+    "The radiographic examination shows normal cardiac silhouette "
+    "and no evidence of pneumonia or pleural effusion.",
+    "Bilateral lung fields are clear without focal consolidation. "
+    "Cardiac outline is within normal limits.",
+    "No acute abnormalities detected in the chest radiograph. "
+    "Recommend clinical correlation.",
+    "The imaging study reveals normal findings consistent with "
+    "healthy lung tissue and cardiac structure.",
+)
+
+# MedBLIPTool.ensure_loaded가 모델 로드를 직렬화할 때 사용
+_model_load_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1024)
+def _verify_image_file(path: str, size: int, mtime_ns: int) -> bool:
+    """이미지 파일 무결성 검사 (픽셀 디코딩 없이 verify, 파일이 바뀌지 않았으면 캐시된 결과)"""
+    _ = size, mtime_ns  # 캐시 키에만 사용 (파일이 바뀌면 다시 검사)
+    try:
+        with Image.open(path) as image:
+            image.verify()
+        return True
+    except Exception:
+        return False
+
+
+class _AsyncAnalysisBatcher:
+    """한 이벤트 루프에서 동시에 들어온 비동기 분석 요청을 모아 배치 generate로 실행
+
+    generate는 한 번에 하나만 스레드풀에서 실행하고, 그동안 쌓인 요청은
+    다음 analyze_medical_images 호출 한 번으로 합쳐 처리합니다.
+    """
+
+    def __init__(self, tool: "MedBLIPTool"):
+        self.tool = tool
+        self.pending: List[Tuple[Union[str, Image.Image], asyncio.Future]] = []
+        self.lock = asyncio.Lock()
+        self.flush_tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, image_input: Union[str, Image.Image]) -> str:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((image_input, future))
+        if len(self.pending) == 1:
+            # 대기열이 비어 있었을 때만 flush 예약 (이후 요청은 같은 배치에 합류)
+            task = loop.create_task(self._flush())
+            self.flush_tasks.add(task)
+            task.add_done_callback(self.flush_tasks.discard)
+        return await future
+
+    async def _flush(self) -> None:
+        async with self.lock:
+            batch, self.pending = self.pending, []
+            if not batch:
+                return
+            inputs = [image_input for image_input, _ in batch]
+            try:
+                results = await asyncio.get_running_loop().run_in_executor(
+                    None, self.tool.analyze_medical_images, inputs
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
 class MedBLIPTool(BaseTool):
     """
     MedBLIP 모델을 LangChain Tool로 래핑
@@ -41,12 +157,26 @@ class MedBLIPTool(BaseTool):
     model: Optional[Any] = Field(default=None, exclude=True)
     processor: Optional[Any] = Field(default=None, exclude=True)
     model_loaded: bool = Field(default=False, exclude=True)
-
+    load_attempted: bool = Field(default=False, exclude=True)
+    device: str = Field(default="cpu", exclude=True)
+    # asyncio 객체는 루프에 묶이므로 이벤트 루프별로 batcher를 둠
+    _async_batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncAnalysisBatcher]" = (
+        PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+    )
 
     def __init__(self, **kwargs):
+        # 모델은 분석이 처음 필요할 때 로드 (get_supported_formats/validate_image는 로드 불필요)
         logger.info("🚀 MedBLIPTool 초기화 시작")
         super().__init__(**kwargs)
-        self._load_model()
+
+    def ensure_loaded(self) -> None:
+        """모델을 아직 로드하지 않았다면 로드 (동시 첫 호출에도 한 번만 로드)"""
+        if self.load_attempted:
+            return
+        with _model_load_lock:
+            if not self.load_attempted:
+                self._load_model()
+                self.load_attempted = True
 
     def _load_model(self):
         """MedBLIP 모델 로드"""
@@ -54,10 +184,19 @@ class MedBLIPTool(BaseTool):
         try:
             model, processor, resolved_path = load_medblip_model()
             if model is not None and processor is not None:
+                # 디바이스 이동은 로드 시 한 번만 수행
+                self.device = "cuda" if torch.cuda.is_available() else "cpu"
+                if self.device == "cuda":
+                    # autocast 밖에서 fp32로 남는 연산도 TF32 텐서 코어를 사용 (프로세스 전역 설정)
+                    torch.set_float32_matmul_precision("high")
+                # device_map으로 배치된 모델(8-bit 등)은 이미 디바이스에 올라가 있음
+                if getattr(model, "hf_device_map", None) is None:
+                    model = model.to(self.device)
                 self.model = model
                 self.processor = processor
                 self.model_loaded = True
                 logger.info(f"✅ MedBLIP 모델 로딩 성공: {resolved_path}")
+                self._warmup()
             else:
                 logger.warning("⚠️ MedBLIP 모델 로딩 실패 - 데모 모드로 동작")
                 self.model_loaded = False
@@ -80,81 +219,273 @@ class MedBLIPTool(BaseTool):
             logger.error(f"❌ Tool 실행 중 오류: {str(e)}")
             return f"이미지 분석 중 오류 발생: {str(e)}"
 
+    async def _arun(
+        self,
+        image_input: Union[str, Image.Image],
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> str:
+        """비동기 도구 실행 메서드 (이벤트 루프를 막지 않고, 동시 요청은 배치로 분석)"""
+        _ = run_manager  # Suppress unused variable warning
+        logger.info("🔧 LangChain Tool 비동기 인터페이스를 통한 이미지 분석 호출")
+        loop = asyncio.get_running_loop()
+        batcher = self._async_batchers.get(loop)
+        if batcher is None:
+            batcher = _AsyncAnalysisBatcher(self)
+            self._async_batchers[loop] = batcher
+        try:
+            return await batcher.submit(image_input)
+        except Exception as e:
+            logger.error(f"❌ Tool 실행 중 오류: {str(e)}")
+            return f"이미지 분석 중 오류 발생: {str(e)}"
+
     def analyze_medical_image(
         self,
         image_input: Union[str, Image.Image],
-        max_length: int = 100,
-        num_beams: int = 5
+        max_new_tokens: int = DEFAULT_MAX_NEW_TOKENS,
+        min_new_tokens: int = DEFAULT_MIN_NEW_TOKENS,
+        num_beams: int = DEFAULT_NUM_BEAMS
     ) -> str:
         """
         의료 이미지 분석 수행
 
         Args:
             image_input: PIL Image 객체 또는 이미지 파일 경로
-            max_length: 생성할 최대 토큰 수
+            max_new_tokens: 새로 생성할 최대 토큰 수 (프롬프트 토큰 제외)
+            min_new_tokens: 새로 생성할 최소 토큰 수
             num_beams: Beam search를 위한 빔 수
 
         Returns:
             의료 영상 분석 결과 텍스트
         """
-        logger.info("🔍 의료 이미지 분석 시작")
+        return self.analyze_medical_images(
+            [image_input], max_new_tokens=max_new_tokens,
+            min_new_tokens=min_new_tokens, num_beams=num_beams
+        )[0]
+
+    def analyze_medical_images(
+        self,
+        image_inputs: List[Union[str, Image.Image]],
+        max_new_tokens: int = DEFAULT_MAX_NEW_TOKENS,
+        min_new_tokens: int = DEFAULT_MIN_NEW_TOKENS,
+        num_beams: int = DEFAULT_NUM_BEAMS
+    ) -> List[str]:
+        """
+        여러 의료 이미지를 한 번의 generate 호출로 배치 분석
+
+        Args:
+            image_inputs: PIL Image 객체 또는 이미지 파일 경로 리스트
+            max_new_tokens: 새로 생성할 최대 토큰 수 (프롬프트 토큰 제외)
+            min_new_tokens: 새로 생성할 최소 토큰 수
+            num_beams: Beam search를 위한 빔 수
 
+        Returns:
+            입력 순서와 동일한 의료 영상 분석 결과 텍스트 리스트
+            (모델이 로드되지 않은 경우에만 데모 결과)
+
+        Raises:
+            RuntimeError: 이미지 로드/추론이 실패한 경우 (실제 이미지에 데모 소견을 반환하지 않음)
+        """
+        logger.info(f"🔍 의료 이미지 분석 시작 ({len(image_inputs)}장)")
+
+        if not image_inputs:
+            return []
+
+        self.ensure_loaded()
         if not self.model_loaded:
             logger.warning("⚠️ MedBLIP 모델 미로드 - 데모 모드로 분석")
-            return self._demo_analysis()
+            return [self._demo_analysis() for _ in image_inputs]
 
         try:
             # 이미지 준비
             logger.info("🖼️ 이미지 전처리 중...")
-            if isinstance(image_input, str):
-                image = Image.open(image_input).convert('RGB')
-                logger.info(f"📁 파일에서 이미지 로드: {image_input}")
-            elif isinstance(image_input, Image.Image):
-                image = image_input.convert('RGB')
-                logger.info("🖼️ PIL Image 객체 사용")
-            else:
-                raise ValueError("지원하지 않는 이미지 형식입니다.")
-
-            # 모델 입력 준비
-            logger.info("🔧 모델 입력 준비 중...")
-            inputs = self.processor(images=image, return_tensors="pt")
-            pixel_values = inputs.pixel_values
-
-            # GPU 사용 가능한 경우 이동
-            if torch.cuda.is_available() and hasattr(self.model, 'to'):
-                logger.info("🚀 GPU 가속 사용")
-                self.model = self.model.to('cuda')
-                pixel_values = pixel_values.to('cuda')
+            path_count = sum(isinstance(image_input, str) for image_input in image_inputs)
+            if path_count > 1:
+                # 파일 디코딩(libjpeg/libpng)은 GIL을 놓으므로 여러 파일은 스레드로 병렬 디코딩
+                workers = min(MAX_DECODE_WORKERS, os.cpu_count() or 1, path_count)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    images = list(executor.map(self._load_image, image_inputs))
             else:
-                logger.info("💻 CPU 추론 사용")
-
-            # 추론 수행
-            logger.info("🧠 MedBLIP 모델 추론 중...")
-            with torch.no_grad():
-                generated_ids = self.model.generate(
-                    pixel_values=pixel_values,
-                    max_length=max_length,
-                    num_beams=num_beams,
-                    early_stopping=True,
-                    do_sample=False
-                )
+                images = [self._load_image(image_input) for image_input in image_inputs]
 
-            # 결과 디코딩
-            logger.info("📝 분석 결과 디코딩 중...")
-            generated_text = self.processor.batch_decode(
-                generated_ids,
-                skip_special_tokens=True
-            )[0]
+            # VRAM 상한을 넘지 않도록 MAX_BATCH_SIZE장씩 나누어 generate
+            generated_texts: List[str] = []
+            for offset in range(0, len(images), MAX_BATCH_SIZE):
+                generated_texts.extend(self._generate_captions(
+                    images[offset:offset + MAX_BATCH_SIZE],
+                    max_new_tokens, min_new_tokens, num_beams
+                ))
 
             # 후처리
-            result = self._postprocess_analysis(generated_text)
+            results = [self._postprocess_analysis(text) for text in generated_texts]
             logger.info("✅ 의료 이미지 분석 완료")
-            return result
+            return results
 
         except Exception as e:
             error_msg = f"MedBLIP 분석 중 오류 발생: {str(e)}"
             logger.error(f"❌ {error_msg}")
-            return self._demo_analysis()
+            raise RuntimeError(error_msg) from e
+
+    def _generate_captions(
+        self,
+        images: List[Union[Image.Image, torch.Tensor]],
+        max_new_tokens: int,
+        min_new_tokens: int,
+        num_beams: int
+    ) -> List[str]:
+        """이미지 배치를 한 번의 generate 호출로 캡션 생성 (후처리 전 원문)"""
+        # 모델 입력 준비 - [N, 3, H, W] 단일 배치로 스택
+        logger.info("🔧 모델 입력 준비 중...")
+        pixel_values = self._preprocess_on_device(images)
+        if pixel_values is None:
+            # torchvision이 없으면: uint8 상태에서 먼저 입력 크기로 줄인 뒤 processor는 rescale/normalize만 수행
+            images, resized = self._resize_to_input(images)
+            inputs = self.processor(
+                images=images, return_tensors="pt", do_resize=not resized
+            )
+            pixel_values = inputs.pixel_values
+        # 입력을 가중치 dtype(GPU에서는 bf16/fp16)에 맞춤
+        pixel_values = pixel_values.to(self.device, dtype=self.model.dtype)
+
+        # 추론 수행 (배치 전체를 한 번의 forward로 처리)
+        logger.info(f"🧠 MedBLIP 모델 추론 중... (device={self.device})")
+        with torch.inference_mode(), self._autocast():
+            # max_new_tokens + KV cache: 디코딩 길이 상한이 입력과 무관하게 고정됨
+            generated_ids = self.model.generate(
+                pixel_values=pixel_values,
+                max_new_tokens=max_new_tokens,
+                min_new_tokens=min_new_tokens,
+                num_beams=num_beams,
+                # early_stopping은 beam search에서만 의미가 있음
+                early_stopping=num_beams > 1,
+                do_sample=False,
+                use_cache=True
+            )
+
+        # 결과 디코딩 (단일 이미지는 리스트를 만들지 않고 바로 decode)
+        logger.info("📝 분석 결과 디코딩 중...")
+        if len(generated_ids) == 1:
+            generated_texts = [
+                self.processor.decode(generated_ids[0], skip_special_tokens=True)
+            ]
+        else:
+            generated_texts = self.processor.batch_decode(
+                generated_ids,
+                skip_special_tokens=True
+            )
+
+        return generated_texts
+
+    def _warmup(self):
+        """GPU 또는 torch.compile 사용 시 첫 요청의 지연을 로드 시점으로 이동"""
+        if self.device != "cuda" and not torch_compile_enabled():
+            return
+        try:
+            logger.info("🔥 MedBLIP 워밍업 추론 중...")
+            with self._autocast():
+                warmup_medblip_model(self.model, self.device)
+            logger.info("✅ MedBLIP 워밍업 완료")
+        except Exception as e:
+            # torch.compile은 첫 forward에서야 실패하므로, 컴파일된 인코더가 원인이면 eager로 되돌림
+            # (그대로 두면 이후 모든 generate가 실패함)
+            if not restore_eager_vision_model(self.model):
+                logger.warning(f"⚠️ MedBLIP 워밍업 실패 (무시): {str(e)}")
+                return
+            logger.warning(f"⚠️ torch.compile 워밍업 실패 - eager 인코더로 복원: {str(e)}")
+            try:
+                with self._autocast():
+                    warmup_medblip_model(self.model, self.device)
+                logger.info("✅ MedBLIP 워밍업 완료 (eager)")
+            except Exception as retry_error:
+                logger.warning(f"⚠️ MedBLIP 워밍업 실패 (무시): {str(retry_error)}")
+
+    def _autocast(self):
+        """GPU에서는 bf16(미지원 시 fp16) autocast, CPU에서는 no-op 컨텍스트"""
+        if self.device != "cuda":
+            return nullcontext()
+        dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        return torch.autocast("cuda", dtype=dtype)
+
+    def _preprocess_on_device(
+        self, images: List[Union[Image.Image, torch.Tensor]]
+    ) -> Optional[torch.Tensor]:
+        """resize/rescale/normalize를 torchvision v2로 모델 디바이스에서 수행 (불가하면 None → processor 사용)
+
+        CUDA: 큰 방사선 영상(4K 등)은 CPU 리사이즈가 전처리 시간을 대부분 차지하므로,
+        원본 uint8 텐서를 한 번만 GPU로 복사한 뒤 나머지 연산을 GPU에서 처리합니다.
+        CPU: uint8 상태에서 먼저 리사이즈해 작은 텐서만 float로 변환합니다.
+        결과는 미리 할당한 [N, 3, H, W] 텐서에 바로 채워 stack 복사를 생략합니다.
+        """
+        if transforms_v2 is None:
+            return None
+        try:
+            image_processor = self.processor.image_processor
+            size = [image_processor.size["height"], image_processor.size["width"]]
+            F = transforms_v2.functional
+            bicubic = transforms_v2.InterpolationMode.BICUBIC
+            on_cuda = self.device == "cuda"
+            batch = torch.empty(
+                (len(images), 3, *size), dtype=torch.float32, device=self.device
+            )
+            for i, image in enumerate(images):
+                tensor = F.pil_to_tensor(image) if isinstance(image, Image.Image) else image
+                if on_cuda:
+                    tensor = tensor.pin_memory().to(self.device, non_blocking=True)
+                    tensor = F.to_dtype(tensor, torch.float32, scale=True)
+                    tensor = F.resize(tensor, size, interpolation=bicubic, antialias=True)
+                else:
+                    tensor = F.resize(tensor, size, interpolation=bicubic, antialias=True)
+                    tensor = F.to_dtype(tensor, torch.float32, scale=True)
+                batch[i] = tensor.clamp_(0.0, 1.0)
+            return F.normalize(
+                batch, image_processor.image_mean, image_processor.image_std, inplace=True
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ torchvision 전처리 실패 - processor 사용: {str(e)}")
+            return None
+
+    def _resize_to_input(
+        self, images: List[Union[Image.Image, torch.Tensor]]
+    ) -> Tuple[List[Union[Image.Image, torch.Tensor]], bool]:
+        """모델 입력 크기로 uint8 리사이즈 (전체가 리사이즈되면 True)
+
+        processor는 float32로 변환한 뒤 리사이즈하므로, 큰 원본은 여기서 먼저 줄여
+        full-resolution float 버퍼를 만들지 않도록 합니다.
+        """
+        image_processor = self.processor.image_processor
+        width, height = image_processor.size["width"], image_processor.size["height"]
+        resized = []
+        for image in images:
+            if isinstance(image, Image.Image):
+                if image.size != (width, height):
+                    image = image.resize((width, height), Image.BICUBIC)
+            elif transforms_v2 is not None:
+                image = transforms_v2.functional.resize(
+                    image, [height, width],
+                    interpolation=transforms_v2.InterpolationMode.BICUBIC,
+                    antialias=True
+                )
+            else:
+                return images, False
+            resized.append(image)
+        return resized, True
+
+    def _load_image(
+        self, image_input: Union[str, Image.Image]
+    ) -> Union[Image.Image, torch.Tensor]:
+        """분석 입력을 RGB 이미지(PIL Image 또는 uint8 CHW 텐서)로 변환"""
+        if isinstance(image_input, str):
+            logger.info(f"📁 파일에서 이미지 로드: {image_input}")
+            if decode_image is not None and not image_input.lower().endswith(".dcm"):
+                # torchvision이 있으면 파일을 바로 텐서로 디코딩
+                return decode_image(read_file(image_input), mode=ImageReadMode.RGB)
+            return Image.open(image_input).convert('RGB')
+        if isinstance(image_input, Image.Image):
+            logger.info("🖼️ PIL Image 객체 사용")
+            # 이미 RGB면 convert()의 불필요한 복사를 생략
+            if image_input.mode == 'RGB':
+                return image_input
+            return image_input.convert('RGB')
+        raise ValueError("지원하지 않는 이미지 형식입니다.")
 
     def _postprocess_analysis(self, raw_text: str) -> str:
         """
@@ -171,13 +502,8 @@ class MedBLIPTool(BaseTool):
 
         # 의료진을 위한 형식으로 정리
         if processed_text:
-            # 첫 글자 대문자로 변경
-            if len(processed_text) > 1:
-                processed_text = (
-                    processed_text[0].upper() + processed_text[1:]
-                )
-            else:
-                processed_text = processed_text.upper()
+            # 첫 글자 대문자로 변경 (한 글자여도 슬라이스는 빈 문자열이라 그대로 동작)
+            processed_text = processed_text[0].upper() + processed_text[1:]
 
             # 마침표가 없으면 추가
             if not processed_text.endswith('.'):
@@ -194,21 +520,7 @@ class MedBLIPTool(BaseTool):
         Returns:
             데모 분석 결과
         """
-        demo_results = [
-            "Chest X-ray demonstrates clear lung fields with no acute "
-            "cardiopulmonary abnormalities. Heart size appears normal.",
-            "The radiographic examination shows normal cardiac silhouette "
-            "and no evidence of pneumonia or pleural effusion.",
-            "Bilateral lung fields are clear without focal consolidation. "
-            "Cardiac outline is within normal limits.",
-            "No acute abnormalities detected in the chest radiograph. "
-            "Recommend clinical correlation.",
-            "The imaging study reveals normal findings consistent with "
-            "healthy lung tissue and cardiac structure."
-        ]
-
-        import random
-        return random.choice(demo_results)
+        return random.choice(_DEMO_RESULTS)
 
     def get_model_info(self) -> Dict[str, Any]:
         """
@@ -217,13 +529,11 @@ class MedBLIPTool(BaseTool):
         Returns:
             모델 상태 및 정보
         """
+        self.ensure_loaded()
         return {
             "model_loaded": self.model_loaded,
             "model_type": "MedBLIP" if self.model_loaded else "Demo Mode",
-            "device": (
-                "cuda" if torch.cuda.is_available() and self.model_loaded
-                else "cpu"
-            ),
+            "device": self.device,
             "status": "Ready" if self.model_loaded else "Demo Mode - Model not loaded"
         }
 
@@ -239,9 +549,12 @@ class MedBLIPTool(BaseTool):
         """
         try:
             if isinstance(image_input, str):
-                if not os.path.exists(image_input):
+                if not os.path.isfile(image_input):
                     return False
-                Image.open(image_input)
+                stat = os.stat(image_input)
+                return _verify_image_file(
+                    os.path.abspath(image_input), stat.st_size, stat.st_mtime_ns
+                )
             elif isinstance(image_input, Image.Image):
                 # PIL Image 객체인 경우 기본적으로 유효
                 pass
@@ -262,14 +575,46 @@ class MedBLIPTool(BaseTool):
 
 
 # LangChain Tools 호환성을 위한 팩토리 함수
+# 편의 함수들이 공유하는 MedBLIP 도구 (모델 가중치는 프로세스당 한 번만 로드)
+_tool_singleton: Optional[MedBLIPTool] = None
+_tool_lock = threading.Lock()
+
+
+def get_shared_medblip_tool() -> MedBLIPTool:
+    """
+    프로세스 공유 MedBLIP 도구 반환 (첫 호출 시 생성, 이후 같은 인스턴스 재사용)
+
+    에이전트/오케스트레이터가 모두 이 인스턴스를 쓰므로 GPU에는 가중치가 한 벌만 올라갑니다.
+
+    Returns:
+        MedBLIP 도구 인스턴스
+    """
+    global _tool_singleton
+    if _tool_singleton is None:
+        with _tool_lock:
+            # 다른 스레드가 먼저 생성했을 수 있으므로 잠금 안에서 다시 확인
+            if _tool_singleton is None:
+                _tool_singleton = MedBLIPTool()
+    return _tool_singleton
+
+
+def reset_shared_medblip_tool() -> None:
+    """
+    공유 MedBLIP 도구를 버림 (다음 get_shared_medblip_tool 호출 시 모델을 다시 로드)
+    """
+    global _tool_singleton
+    with _tool_lock:
+        _tool_singleton = None
+
+
 def create_medblip_tool() -> MedBLIPTool:
     """
-    MedBLIP 도구 인스턴스 생성
+    MedBLIP 도구 인스턴스 반환 (공유 인스턴스, get_shared_medblip_tool 참조)
 
     Returns:
         MedBLIP 도구 인스턴스
     """
-    return MedBLIPTool()
+    return get_shared_medblip_tool()
 
 
 # 편의 함수들
@@ -287,24 +632,20 @@ def quick_analyze(image_input: Union[str, Image.Image]) -> str:
     return tool.analyze_medical_image(image_input)
 
 
-def batch_analyze(image_inputs: list) -> list:
+def batch_analyze(image_inputs: list, max_new_tokens: int = DEFAULT_MAX_NEW_TOKENS) -> list:
     """
     여러 이미지 배치 분석
 
     Args:
         image_inputs: 분석할 이미지들의 리스트
+        max_new_tokens: 이미지당 새로 생성할 최대 토큰 수
 
     Returns:
         각 이미지의 분석 결과 리스트
     """
     tool = create_medblip_tool()
-    results = []
-
-    for image_input in image_inputs:
-        try:
-            result = tool.analyze_medical_image(image_input)
-            results.append(result)
-        except Exception as e:
-            results.append(f"분석 실패: {str(e)}")
-
-    return results
+    # 이미지별 반복 대신 MAX_BATCH_SIZE 단위의 배치 generate로 한 번에 분석
+    try:
+        return tool.analyze_medical_images(list(image_inputs), max_new_tokens=max_new_tokens)
+    except Exception as e:
+        return [f"분석 실패: {str(e)}" for _ in image_inputs]